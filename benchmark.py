@@ -0,0 +1,196 @@
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from quality import get_quality
+from render_all import ROOT, discover_scenes, get_env, get_renderer
+
+
+def count_mobjects(counter):
+    # counter[0] goes up by one for every Mobject (or OpenGLMobject) constructed from now on
+    from manim import Mobject
+    from manim.mobject.opengl.opengl_mobject import OpenGLMobject
+
+    for cls in (Mobject, OpenGLMobject):
+        init = cls.__init__
+
+        def counted_init(self, *args, init=init, **kwargs):
+            counter[0] += 1
+            init(self, *args, **kwargs)
+
+        cls.__init__ = counted_init
+
+
+def time_calls(scene, calls, on_start=None, on_end=None):
+    # Wraps scene.play and scene.wait so each call is appended to calls with its scene time and wall time.
+    # on_start(call, frame) gets the caller's frame to add its own fields, on_end(call) runs once the call is done.
+    depth = [0]
+
+    def timed(method, kind):
+        def call(*args, **kwargs):
+            # Scene.wait goes through Scene.play; only the outermost call is recorded
+            if depth[0]:
+                return method(*args, **kwargs)
+            frame = sys._getframe(1)
+            record = {"index": len(calls), "kind": kind, "line": frame.f_lineno, "start": scene.renderer.time}
+            if on_start:
+                on_start(record, frame)
+            depth[0] += 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record["seconds"] = time.perf_counter() - start
+                depth[0] -= 1
+                record["duration"] = scene.renderer.time - record["start"]
+                if on_end:
+                    on_end(record)
+                calls.append(record)
+
+        return call
+
+    scene.play = timed(scene.play, "play")
+    scene.wait = timed(scene.wait, "wait")
+
+
+def run_scene(file_name, scene_name, renderer, rasterize=True, track_memory=False):
+    # Runs in its own interpreter (manim's config is global): the full construct() with every play/wait and
+    # updater timed, but no movie file, no ffmpeg and, without rasterize, no drawing of frames either
+    from manim import config
+    from updaters import UpdaterProfile
+
+    config.renderer = renderer
+    config.write_to_movie = False
+    config.save_last_frame = False
+    config.preview = False
+    module = importlib.import_module(Path(file_name).stem)
+
+    profile = UpdaterProfile(track_memory=track_memory)
+    profile.install()
+    created = [0]
+    count_mobjects(created)
+
+    scene = getattr(module, scene_name)()
+    if not rasterize:
+        scene.renderer.update_frame = lambda *args, **kwargs: None
+
+    calls = []
+
+    def on_start(call, frame):
+        call["mobjects_created"] = created[0]
+
+    def on_end(call):
+        frames = max(round(call["duration"] * config.frame_rate), 1)
+        call["mobjects_created"] = created[0] - call["mobjects_created"]
+        call["ms_per_frame"] = 1000 * call["seconds"] / frames
+        call["mobjects_per_frame"] = call["mobjects_created"] / frames
+
+    time_calls(scene, calls, on_start, on_end)
+
+    start = time.perf_counter()
+    scene.render()
+    total = time.perf_counter() - start
+
+    frames = sum(max(round(call["duration"] * config.frame_rate), 1) for call in calls)
+    return {
+        "scene": scene_name,
+        "file": file_name,
+        "renderer": str(config.renderer.value),
+        "rasterize": rasterize,
+        "resolution": [config.pixel_width, config.pixel_height],
+        "frame_rate": config.frame_rate,
+        "seconds": total,
+        "frames": frames,
+        "ms_per_frame": 1000 * total / frames if frames else 0.0,
+        "mobjects_created": created[0],
+        "calls": calls,
+        "updaters": profile.report(),
+    }
+
+
+def benchmark(scene_names=None, rasterize=True, track_memory=False, headless=False):
+    # discover_scenes() only returns the scenes of the video, so demos are left out here as in render_all
+    scenes = discover_scenes()
+    if scene_names:
+        scenes = [scene for scene in scenes if scene[1] in scene_names]
+    # Scenes run one at a time, so a headless OpenGL scene gets every core
+    gl_threads = (os.cpu_count() or 1) if headless else None
+
+    reports = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        # One after the other on purpose: parallel runs would time each other
+        for file_name, scene_name, flags in scenes:
+            output_file = Path(output_dir) / f"{scene_name}.json"
+            command = [
+                sys.executable, __file__, "--worker", file_name, scene_name,
+                "--renderer", get_renderer(flags), "--output", str(output_file),
+            ]
+            if not rasterize:
+                command.append("--no-raster")
+            if track_memory:
+                command.append("--memory")
+            env = get_env(get_quality(), flags, gl_threads)
+            result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, env=env)
+            if result.returncode != 0:
+                print(f"{scene_name:<26} FAILED ({result.returncode})")
+                print(result.stderr[-2000:])
+                continue
+
+            report = json.loads(output_file.read_text())
+            reports.append(report)
+            top = report["updaters"][0]["name"] if report["updaters"] else "-"
+            print(
+                f"{scene_name:<26} {report['seconds']:8.2f}s  {report['frames']:6d} frames  "
+                f"{report['ms_per_frame']:7.2f} ms/frame  slowest updater: {top}",
+                flush=True,
+            )
+
+    commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    return {"commit": commit, "rasterize": rasterize, "scenes": reports}
+
+
+def compare(old, new):
+    old_scenes = {report["scene"]: report for report in old["scenes"]}
+    print(f"\n{'scene':<26} {'before':>9} {'after':>9} {'change':>8}")
+    for report in new["scenes"]:
+        if report["scene"] not in old_scenes:
+            continue
+        before = old_scenes[report["scene"]]["ms_per_frame"]
+        after = report["ms_per_frame"]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{report['scene']:<26} {before:8.2f}ms {after:8.2f}ms {change:+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every scene, play/wait call and updater without writing video.")
+    parser.add_argument("scenes", nargs="*", help="Scene class names to benchmark (default: all)")
+    parser.add_argument("--no-raster", action="store_true", help="Skip drawing frames as well, timing only scene logic")
+    parser.add_argument("--memory", action="store_true", help="Also measure what each updater allocates (tracemalloc, slower)")
+    parser.add_argument("-o", "--output", default="benchmark.json", help="Where to write the JSON report")
+    parser.add_argument("--compare", help="Earlier JSON report to print per-scene changes against")
+    parser.add_argument("--headless", action="store_true", help="Run OpenGL scenes offscreen with software OpenGL (EGL surfaceless, llvmpipe)")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--renderer", default="cairo", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        file_name, scene_name = args.scenes
+        report = run_scene(file_name, scene_name, args.renderer, rasterize=not args.no_raster, track_memory=args.memory)
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        return
+
+    report = benchmark(args.scenes, rasterize=not args.no_raster, track_memory=args.memory, headless=args.headless)
+    Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True))
+    print(f"Report written to {args.output}")
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text()), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+from manim import *
+import numpy as np
+from collections import OrderedDict
+
+# Upper bound on one block of precomputed projections, (frames, points, 3) floats
+BLOCK_BYTES = 32 * 1024 * 1024
+
+
+def get_camera_key(camera):
+    return np.array([
+        camera.get_phi(),
+        camera.get_theta(),
+        camera.get_gamma(),
+        camera.get_focal_distance(),
+        camera.get_zoom(),
+        *camera.frame_center,
+    ])
+
+
+def rotation_matrices(phi, thetas, gamma):
+    # ThreeDCamera.generate_rotation_matrix for many thetas at once: Rz(gamma) @ Rx(-phi) @ Rz(-theta - 90 deg)
+    angles = -np.asarray(thetas) - 90 * DEGREES
+    cos, sin = np.cos(angles), np.sin(angles)
+    about_z = np.zeros((len(angles), 3, 3))
+    about_z[:, 0, 0] = cos
+    about_z[:, 0, 1] = -sin
+    about_z[:, 1, 0] = sin
+    about_z[:, 1, 1] = cos
+    about_z[:, 2, 2] = 1
+    return np.dot(rotation_about_z(gamma), rotation_matrix(-phi, RIGHT)) @ about_z
+
+
+def project_batch(camera, points, rotations):
+    # ThreeDCamera.project_points for a stack of rotations: (N, 3) points -> (frames, N, 3)
+    focal_distance = camera.get_focal_distance()
+    zoom = camera.get_zoom()
+    projected = np.einsum("nj,fij->fni", points - camera.frame_center, rotations)
+    zs = projected[:, :, 2]
+    if camera.exponential_projection:
+        factor = np.exp(zs / focal_distance)
+        behind = zs < 0
+        factor[behind] = focal_distance / (focal_distance - zs[behind])
+    else:
+        factor = focal_distance / (focal_distance - zs)
+        factor[(focal_distance - zs) < 0] = 10**6
+    projected[:, :, :2] *= (factor * zoom)[:, :, None]
+    return projected
+
+
+class PathCamera(ThreeDCamera):
+    # Geometry registered with add_static_geometry is projected for all of its points in one batched operation
+    # per frame instead of one project_points call per submobject. While the camera moves along a straight path
+    # in theta (the ambient rotation), the next frames' view matrices are sampled ahead and the static geometry
+    # is projected for a whole block of frames at once; any other camera move falls back to the per-frame batch.
+    # Projections and depth keys of other poses are kept, so a pose that comes back (every play redraws the
+    # static image, a wait without rotation redraws the same view) costs a lookup.
+    def __init__(self, *args, pose_cache_size=16, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pose_cache_size = pose_cache_size
+        self.static_mobjects = []
+        self.static_slices = {}
+        self.static_family = set()
+        self.static_points = np.zeros((0, 3))
+        self.static_depths = {}
+        self.static_reference_points = np.zeros((0, 3))
+        self.pose_cache = OrderedDict()
+        self.block_keys = None
+        self.block = None
+        self.block_index = 0
+        self.last_key = None
+        self.current_pose = None
+        self.last_display = None
+
+    def add_static_geometry(self, *mobjects):
+        # Only for mobjects whose points no longer change; their points are read once here
+        for mobject in mobjects:
+            self.static_family.update(id(mob) for mob in mobject.get_family())
+            for mob in mobject.family_members_with_points():
+                if id(mob) not in self.static_slices:
+                    self.static_mobjects.append(mob)
+                    self.static_slices[id(mob)] = None
+        counts = [mob.get_num_points() for mob in self.static_mobjects]
+        starts = np.concatenate([[0], np.cumsum(counts)])
+        self.static_slices = {
+            id(mob): slice(start, end) for mob, start, end in zip(self.static_mobjects, starts, starts[1:])
+        }
+        self.static_points = np.vstack([mob.points for mob in self.static_mobjects])
+
+        # Depth-sorted static mobjects keep their reference point, so their sort keys are one matrix product
+        shaded = [
+            mob for mob in self.static_mobjects
+            if getattr(mob, "shade_in_3d", False) and id(getattr(mob, "z_index_group", mob)) in self.static_family
+        ]
+        self.static_depths = {id(mob): i for i, mob in enumerate(shaded)}
+        self.static_reference_points = np.array([mob.get_z_index_reference_point() for mob in shaded]).reshape(-1, 3)
+
+        self.block = None
+        self.pose_cache.clear()
+        self.last_display = None
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        if self.static_mobjects:
+            self.update_static_projection()
+        super().capture_mobjects(mobjects, **kwargs)
+
+    def update_static_projection(self):
+        key = get_camera_key(self)
+        last_key, self.last_key = self.last_key, key
+
+        if self.block is not None and self.block_index < len(self.block):
+            if np.allclose(key, self.block_keys[self.block_index], rtol=0, atol=1e-9):
+                self.current_pose = [self.block[self.block_index], None, key]
+                self.block_index += 1
+                return
+        self.block = None
+
+        step = key - last_key if last_key is not None else None
+        if step is not None and step[1] != 0 and not np.any(np.delete(step, 1)):
+            # Only theta moved since the last frame: assume it keeps moving at the same rate
+            frames = int(np.clip(BLOCK_BYTES // max(self.static_points.nbytes, 1), 1, 240))
+            thetas = key[1] + step[1] * np.arange(frames)
+            self.block_keys = np.repeat(key[None], frames, axis=0)
+            self.block_keys[:, 1] = thetas
+            self.block = project_batch(self, self.static_points, rotation_matrices(key[0], thetas, key[2]))
+            self.current_pose = [self.block[0], None, key]
+            self.block_index = 1
+            return
+
+        pose = key.tobytes()
+        if pose in self.pose_cache:
+            self.pose_cache.move_to_end(pose)
+        else:
+            rotation = rotation_matrices(key[0], [key[1]], key[2])
+            self.pose_cache[pose] = [project_batch(self, self.static_points, rotation)[0], None, key]
+            if len(self.pose_cache) > self.pose_cache_size:
+                self.pose_cache.popitem(last=False)
+        self.current_pose = self.pose_cache[pose]
+
+    def get_static_depths(self):
+        # Same number ThreeDCamera's z_key gives these mobjects, for all of them at once and once per pose
+        if self.current_pose[1] is None:
+            self.current_pose[1] = self.static_reference_points @ self.get_rotation_matrix()[2]
+        return self.current_pose[1]
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        if not self.static_mobjects or self.current_pose is None:
+            return super().get_mobjects_to_display(*args, **kwargs)
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+
+        # Same pose and same mobjects as the last frame, and nothing depth-sorted among them that can move:
+        # the order cannot have changed
+        ids = [id(mob) for mob in mobjects]
+        if self.last_display is not None:
+            last_ids, last_key, last_order, last_static = self.last_display
+            if last_static and ids == last_ids and np.array_equal(last_key, self.current_pose[2]):
+                return list(last_order)
+
+        rotation = self.get_rotation_matrix()
+        static_depths = self.get_static_depths()
+        all_static = True
+        keys = []
+        for mob in mobjects:
+            if not getattr(mob, "shade_in_3d", False):
+                keys.append(np.inf)
+            elif id(mob) in self.static_depths:
+                keys.append(static_depths[self.static_depths[id(mob)]])
+            else:
+                all_static = False
+                keys.append(np.dot(mob.get_z_index_reference_point(), rotation.T)[2])
+        # Stable, like sorted() with the z_key: mobjects that are not shaded in 3D keep their order at the back
+        order = [mobjects[i] for i in sorted(range(len(mobjects)), key=keys.__getitem__)]
+        self.last_display = (ids, self.current_pose[2], order, all_static)
+        return order
+
+    def transform_points_pre_display(self, mobject, points):
+        index = self.static_slices.get(id(mobject))
+        if (
+            index is None
+            or self.current_pose is None
+            or len(points) != index.stop - index.start
+            or mobject in self.fixed_in_frame_mobjects
+            or mobject in self.fixed_orientation_mobjects
+        ):
+            return super().transform_points_pre_display(mobject, points)
+        return self.current_pose[0][index]
+
+
+class PathCameraMixin:
+    # Put in front of ThreeDScene; a no-op with the OpenGL renderer, which projects on the GPU
+    def __init__(self, *args, **kwargs):
+        if config.renderer == RendererType.CAIRO:
+            kwargs.setdefault("camera_class", PathCamera)
+        super().__init__(*args, **kwargs)
+
+    def add_static_geometry(self, *mobjects):
+        camera = self.renderer.camera
+        if isinstance(camera, PathCamera):
+            camera.add_static_geometry(*mobjects)
@@ -2,12 +2,15 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
+from encoding import FastEncodingMixin
+from quality import set_quality
+from svg_cache import enable_svg_point_cache
 
+set_quality()
+enable_svg_point_cache()
 
-class Conclusion(Scene):
+
+class Conclusion(FastEncodingMixin, Scene):
     def construct(self):
         conclusion_text = Text("Thank You!", font_size=96)
         self.play(Write(conclusion_text), run_time=3)
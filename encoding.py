@@ -0,0 +1,216 @@
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import write_to_movie
+from queue import Empty, Queue
+from threading import Thread
+import av
+import numpy as np
+
+from segment_cache import scene_state_digest
+
+
+def wrap_frame(frame):
+    # An av.VideoFrame over the array's own memory where PyAV can do that, so the RGBA frame is read once by the
+    # pixel format conversion instead of first being copied. The camera already stores RGBA byte order (manim
+    # hands cairo its colours channel-reversed), so no reordering is needed either.
+    if hasattr(av.VideoFrame, "from_numpy_buffer"):
+        try:
+            return av.VideoFrame.from_numpy_buffer(frame, format="rgba")
+        except ValueError:
+            pass
+    return av.VideoFrame.from_ndarray(frame, format="rgba")
+
+
+class FastFileWriter(SceneFileWriter):
+    def __init__(self, renderer, scene_name, scene=None, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.scene = scene
+        self.last_keys = (None, None)
+
+    def state_key(self, hash_animation):
+        # manim's own hash misses state that only updaters produce (and is memoized across shared objects),
+        # so partial movie files are named after it plus a digest of the full scene state
+        if self.scene is None:
+            return hash_animation
+        if self.last_keys[0] != hash_animation:
+            self.last_keys = (hash_animation, f"{hash_animation}_{scene_state_digest(self.scene)}")
+        return self.last_keys[1]
+
+    def is_already_cached(self, hash_invocation):
+        return super().is_already_cached(self.state_key(hash_invocation))
+
+    def add_partial_movie_file(self, hash_animation):
+        if hash_animation is not None and not hash_animation.startswith("uncached_"):
+            hash_animation = self.state_key(hash_animation)
+        super().add_partial_movie_file(hash_animation)
+        # Each play call gets a fresh key, even if two consecutive ones hash the same
+        self.last_keys = (None, None)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        stream = self.video_stream
+        if stream.pix_fmt != "yuv420p":
+            return super().encode_and_write_frame(frame, num_frames)
+
+        converted = wrap_frame(frame).reformat(
+            width=stream.width,
+            height=stream.height,
+            format=stream.pix_fmt,
+        )
+        if num_frames == 1:
+            for packet in stream.encode(converted):
+                self.video_container.mux(packet)
+            return
+
+        # A held frame (a static wait is rasterized once and passed here with num_frames > 1): convert it to the
+        # stream's pixel format once, instead of once per repeated frame inside the encoder
+        held = converted.to_ndarray()
+
+        for _ in range(num_frames):
+            # A fresh frame object every time; re-sending the same av.VideoFrame corrupts the output
+            av_frame = av.VideoFrame.from_ndarray(held, format=stream.pix_fmt)
+            for packet in stream.encode(av_frame):
+                self.video_container.mux(packet)
+
+
+class StreamingFileWriter(FastFileWriter):
+    # With caching off there is nothing to reuse partial movie files for, so the whole scene goes through one
+    # encoder straight into the final movie: no per-animation files and no concat pass at the end.
+    # The camera draws straight into a small ring of reusable buffers: a finished frame is handed to the writer
+    # thread as is, and the camera moves on to a free buffer. When the encoder falls ring_size frames behind,
+    # drawing waits for one to come back.
+    ring_size = 8
+
+    def __init__(self, renderer, scene_name, scene=None, **kwargs):
+        super().__init__(renderer, scene_name, scene=scene, **kwargs)
+        self.video_container = None
+        self.writer_error = None
+
+    def is_already_cached(self, hash_invocation):
+        # Every animation has to reach the single stream
+        return False
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write and self.video_container is None:
+            self.open_scene_stream()
+
+    def end_animation(self, allow_write=False):
+        # The stream stays open until finish()
+        pass
+
+    def open_scene_stream(self):
+        # Same codec settings manim uses for its partial movie files
+        self.video_container = av.open(str(self.movie_file_path), mode="w")
+        stream = self.video_container.add_stream(
+            "libx264",
+            rate=to_av_frame_rate(config.frame_rate),
+            options={"an": "1", "crf": "23"},
+        )
+        stream.pix_fmt = "yuv420p"
+        stream.width = config.pixel_width
+        stream.height = config.pixel_height
+        self.video_stream = stream
+
+        # The camera's own pixel array is the first buffer of the ring
+        camera = self.renderer.camera
+        self.free_buffers = Queue()
+        for _ in range(self.ring_size - 1):
+            self.free_buffers.put(np.empty_like(camera.pixel_array))
+        self.queue = Queue()
+        self.writer_thread = Thread(target=self.listen_and_write)
+        self.writer_thread.start()
+
+        # The renderer copies every frame (get_frame) before passing it on; hand over the drawn array instead.
+        # It is safe because update_frame always starts a frame by resetting the whole array.
+        renderer = self.renderer
+
+        def render(scene, time, moving_mobjects):
+            renderer.update_frame(scene, moving_mobjects)
+            renderer.add_frame(renderer.camera.pixel_array)
+
+        def freeze_current_frame(duration):
+            dt = 1 / renderer.camera.frame_rate
+            renderer.add_frame(renderer.camera.pixel_array, num_frames=int(duration / dt))
+
+        renderer.render = render
+        renderer.freeze_current_frame = freeze_current_frame
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if self.video_container is None:
+            return
+        camera = self.renderer.camera
+        if frame_or_renderer is camera.pixel_array:
+            self.queue.put((num_frames, frame_or_renderer))
+            camera.pixel_array = self.get_free_buffer()
+        else:
+            buffer = self.get_free_buffer()
+            np.copyto(buffer, frame_or_renderer)
+            self.queue.put((num_frames, buffer))
+
+    def get_free_buffer(self):
+        # Buffers stop coming back if the writer thread died, so keep checking for its error instead of
+        # waiting forever
+        while True:
+            self.raise_writer_error()
+            try:
+                return self.free_buffers.get(timeout=1)
+            except Empty:
+                pass
+
+    def raise_writer_error(self):
+        if self.writer_error is not None:
+            raise RuntimeError("Encoding the scene stream failed") from self.writer_error
+
+    def listen_and_write(self):
+        while True:
+            num_frames, buffer = self.queue.get()
+            if buffer is None:
+                break
+            try:
+                # The pixels are converted to the stream's format before this returns, so the buffer can be reused
+                self.encode_and_write_frame(buffer, num_frames)
+            except Exception as error:
+                self.writer_error = error
+                break
+            self.free_buffers.put(buffer)
+
+    def finish(self):
+        if self.video_container is not None:
+            self.queue.put((-1, None))
+            self.writer_thread.join()
+            if self.writer_error is not None:
+                container, self.video_container = self.video_container, None
+                try:
+                    container.close()
+                finally:
+                    self.raise_writer_error()
+            for packet in self.video_stream.encode():
+                self.video_container.mux(packet)
+            self.video_container.close()
+            self.video_container = None
+            self.print_file_ready_message(self.movie_file_path)
+            if self.includes_sound:
+                logger.warning("Sounds are not written when streaming; render with caching on to keep them")
+        if self.subcaptions:
+            self.write_subcaption_file()
+
+
+def can_stream():
+    # Only the plain mp4 case; transparent, webm, gif and section output still go through manim's own writer
+    return (
+        config.disable_caching
+        and write_to_movie()
+        and config.movie_file_extension == ".mp4"
+        and not config.transparent
+        and not config.save_sections
+        and config.format != "gif"
+    )
+
+
+class FastEncodingMixin:
+    # Put in front of the Scene base class, e.g. class RegressionMath(FastEncodingMixin, Scene)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        writer_class = StreamingFileWriter if can_stream() else FastFileWriter
+        if writer_class is StreamingFileWriter:
+            logger.info("Caching disabled, streaming the whole scene through one encoder")
+        self.renderer.file_writer = writer_class(self.renderer, type(self).__name__, scene=self)
@@ -2,12 +2,19 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
+from encoding import FastEncodingMixin
+from glyphs import PolynomialEquation
+from quality import set_quality
+from regression_kernel import PolynomialFitter
+from svg_cache import enable_svg_point_cache
+from tex_batch import TexBatchMixin
+from updaters import UpdaterProfileMixin, memoize_on
 
+set_quality()
+enable_svg_point_cache()
 
-class ExtendedRegression(Scene):
+
+class ExtendedRegression(FastEncodingMixin, TexBatchMixin, UpdaterProfileMixin, Scene):
     def construct(self):
         # Now, let's see how we can put all this knowledge together to actually find a regression line given a set of points mathematically.
 
@@ -114,12 +121,20 @@ class ExtendedRegression(Scene):
 
         t_tracker = ValueTracker(0.0)
 
-        def current_y_values():
-            t = t_tracker.get_value()
+        # Memoized on t_tracker: the dots, the curve (which samples the polynomial many times) and the equation
+        # all share one evaluation per frame
+        @memoize_on(t_tracker)
+        def current_y_values(t):
             return base_y + amplitudes * np.sin(t + phases)
 
-        def current_coeffs():
-            return np.polyfit(x_values, current_y_values(), 3)
+        # y(t) = base_y + sin(t) * amp * cos(phase) + cos(t) * amp * sin(phase), and the fit is linear in y,
+        # so fitting those three vectors once gives the exact coefficients for every t
+        fitter = PolynomialFitter(x_values, 3)
+        coeff_basis = fitter.fit(np.array([base_y, amplitudes * np.cos(phases), amplitudes * np.sin(phases)]))
+
+        @memoize_on(t_tracker)
+        def current_coeffs(t):
+            return np.array([1.0, np.sin(t), np.cos(t)]) @ coeff_basis
 
         # Place dots at updater-consistent positions (t=0)
         y0 = current_y_values()
@@ -129,14 +144,11 @@ class ExtendedRegression(Scene):
             for x, y in zip(x_values, y0)
         ])
 
-        def dot_updater(mob, x, amp, phase, base):
-            t = t_tracker.get_value()
-            y = base + amp * np.sin(t + phase)
-            mob.move_to(plane.c2p(x, y))
+        def dot_updater(mob, i):
+            mob.move_to(plane.c2p(x_values[i], current_y_values()[i]))
 
-        for dot, x, amp, phase, base in zip(dots, x_values, amplitudes, phases, base_y):
-            dot.add_updater(lambda m, x=x, amp=amp, phase=phase, base=base:
-                            dot_updater(m, x, amp, phase, base))
+        for i, dot in enumerate(dots):
+            dot.add_updater(lambda m, i=i: dot_updater(m, i))
 
         self.play(AnimationGroup(*[FadeIn(dot) for dot in dots], lag_ratio=0.08), run_time=2)
 
@@ -153,40 +165,16 @@ class ExtendedRegression(Scene):
 
         # 36
 
-        def build_equation(coeffs):
-            cleaned = [0.0 if abs(c) < 1e-4 else c for c in coeffs]
-            a, b, c, d = cleaned
-
-            parts = []
-            for idx, (coeff, power) in enumerate([(a, 3), (b, 2), (c, 1), (d, 0)]):
-                sign = "-" if coeff < 0 else "+"
-                value = abs(coeff)
-
-                if power == 0:
-                    term = f"{value:.2f}"
-                elif power == 1:
-                    term = f"{value:.2f}x"
-                else:
-                    term = f"{value:.2f}x^{{{power}}}"
-
-                if idx == 0:
-                    parts.append(("-" if coeff < 0 else "") + term)
-                else:
-                    parts.append(f" {sign} {term}")
-
-            tex = "y = " + "".join(parts)
-            return MathTex(tex).scale(0.8)
-
-        equation = build_equation(current_coeffs()).to_edge(UP)
+        # Glyphs are typeset once; every frame after that only moves point arrays around (no LaTeX per frame)
+        equation = PolynomialEquation(current_coeffs(), font_size=0.8 * DEFAULT_FONT_SIZE).to_edge(UP)
         eq_anchor = equation.get_center()
         self.play(FadeIn(equation), run_time=1.5)
 
         # 37.5
 
         def equation_updater(mob):
-            new = build_equation(current_coeffs()).to_edge(UP)
-            new.move_to(eq_anchor)  # prevents equation from sliding with width changes
-            mob.become(new)
+            mob.set_coefficients(current_coeffs())
+            mob.move_to(eq_anchor)  # prevents equation from sliding with width changes
 
         equation.add_updater(equation_updater)
 
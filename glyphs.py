@@ -0,0 +1,208 @@
+from manim import *
+import hashlib
+import re
+import numpy as np
+
+from svg_cache import get_points_dir, get_vmobject_class, save_npz
+
+# Every glyph a live numeric label can show. They are typeset together (so they share a baseline and size) in a
+# single LaTeX run, and afterwards new values are laid out by copying point arrays instead of going through LaTeX.
+# Only these: static expressions (\hat{x}, \bar{y}, \frac, \overrightarrow) need TeX's own layout, so they stay
+# MathTex, one cached svg per string in media/Tex, compiled together by tex_batch.
+GLYPH_TEX = ["y", "=", "+", "-", ".", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "x", "x^{2}", "x^{3}"]
+
+_glyph_sets = {}
+
+
+def glyph_count(tex):
+    # Number of glyphs (SVG paths) a key typesets to, e.g. "x^{2}" -> 2; only valid for the simple keys above
+    return len(re.sub(r"[\^_{}\s]", "", tex))
+
+
+def get_atlas_path(tex_strings, font_size):
+    # The renderer is part of the key: cairo stores cubic curves, OpenGL quadratic ones
+    key = hashlib.sha1(repr((list(tex_strings), font_size, config.renderer)).encode()).hexdigest()[:16]
+    return get_points_dir() / f"glyph_atlas_{key}.npz"
+
+
+class GlyphSet:
+    def __init__(self, tex_strings=GLYPH_TEX, font_size=DEFAULT_FONT_SIZE, placeholder=False):
+        self.font_size = font_size
+        # Every slot of a GlyphLine is a copy of this, so it has to match the renderer's group type
+        self.style_source = get_vmobject_class()(fill_color=WHITE, fill_opacity=1.0, stroke_width=0)
+        self.glyphs = {}
+        self.widths = {}
+
+        if placeholder:
+            # No LaTeX and no atlas: every glyph is a small square (dry runs and tests, where only layout matters)
+            size = 0.2 * font_size / DEFAULT_FONT_SIZE
+            square = Square(side_length=size).move_to([size / 2, size / 2, 0]).points
+            for tex in tex_strings:
+                self.glyphs[tex] = [square.copy()]
+                self.widths[tex] = size
+            return
+
+        # The atlas is a small indexed file next to the parsed SVG points, written by the first run that needs it
+        # (one LaTeX run); only a checkout that has the file skips LaTeX for live labels
+        atlas_path = get_atlas_path(tex_strings, font_size)
+        if atlas_path.exists():
+            self.load(atlas_path)
+        else:
+            self.typeset(tex_strings)
+            self.save(atlas_path)
+
+    def typeset(self, tex_strings):
+        # One LaTeX + dvisvgm run for the whole set; the glyphs come out in typesetting order
+        template = SingleStringMathTex(r" \quad ".join(tex_strings), font_size=self.font_size)
+        leaves = template.family_members_with_points()
+        counts = [glyph_count(tex) for tex in tex_strings]
+        if sum(counts) != len(leaves):
+            raise ValueError(f"Expected {sum(counts)} glyphs when typesetting {tex_strings}, got {len(leaves)}")
+
+        parts = []
+        start = 0
+        for count in counts:
+            parts.append(leaves[start:start + count])
+            start += count
+
+        # "x" has no ascender or descender, so its bottom is the baseline every glyph is placed against
+        baseline = parts[tex_strings.index("x")][0].get_bottom()[1]
+        for tex, part in zip(tex_strings, parts):
+            left = min(leaf.get_left()[0] for leaf in part)
+            right = max(leaf.get_right()[0] for leaf in part)
+            origin = np.array([left, baseline, 0])
+            # One point array per leaf, relative to (left edge, baseline)
+            self.glyphs[tex] = [leaf.points - origin for leaf in part]
+            self.widths[tex] = right - left
+
+    def save(self, path):
+        keys = list(self.glyphs)
+        leaves = [points for key in keys for points in self.glyphs[key]]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        save_npz(
+            path,
+            keys=np.array(keys),
+            widths=np.array([self.widths[key] for key in keys]),
+            leaf_counts=np.array([len(self.glyphs[key]) for key in keys]),
+            point_counts=np.array([len(points) for points in leaves]),
+            points=np.vstack(leaves).astype(np.float32),
+        )
+
+    def load(self, path):
+        with np.load(path) as atlas:
+            points = np.split(atlas["points"].astype(float), np.cumsum(atlas["point_counts"])[:-1])
+            start = 0
+            for key, width, count in zip(atlas["keys"], atlas["widths"], atlas["leaf_counts"]):
+                self.glyphs[str(key)] = points[start:start + count]
+                self.widths[str(key)] = float(width)
+                start += count
+
+
+def get_glyph_set(font_size=DEFAULT_FONT_SIZE):
+    key = (font_size, config.renderer)
+    if key not in _glyph_sets:
+        _glyph_sets[key] = GlyphSet(font_size=font_size)
+    return _glyph_sets[key]
+
+
+class GlyphLine(VGroup):
+    def __init__(self, font_size=DEFAULT_FONT_SIZE, num_slots=48, char_buff=0.04, word_buff=0.2, **kwargs):
+        super().__init__(**kwargs)
+        self.glyph_set = get_glyph_set(font_size)
+        self.char_buff = char_buff * font_size / DEFAULT_FONT_SIZE
+        self.word_buff = word_buff * font_size / DEFAULT_FONT_SIZE
+        # Width of the last layout at the typeset size; the current width over it is how much the line has been
+        # scaled since (by .scale() or inside a scaled group), which every new layout keeps
+        self.layout_width = None
+
+        # A fixed pool of leaf mobjects, so the family never changes between frames (the cairo renderer
+        # collects the moving family once per animation). Unused slots are collapsed by set_words.
+        self.add(*[self.glyph_set.style_source.copy() for _ in range(num_slots)])
+
+    def set_words(self, words, edge=ORIGIN):
+        # words is a list of lists of GLYPH_TEX keys, e.g. [["y"], ["="], ["1", ".", "5", "0", "x"]].
+        # The line keeps the point given by edge where it was (its center by default), and its current size.
+        anchor = ORIGIN
+        scale_factor = 1.0
+        if self.family_members_with_points():
+            anchor = self.get_critical_point(edge)
+            if self.layout_width:
+                scale_factor = self.width / self.layout_width
+
+        cursor = 0.0
+        right = 0.0
+        slot = 0
+        for word in words:
+            for key in word:
+                for points in self.glyph_set.glyphs[key]:
+                    if slot == len(self.submobjects):
+                        self.add(self.glyph_set.style_source.copy())
+                    self.submobjects[slot].set_points(points + np.array([cursor, 0, 0]))
+                    slot += 1
+                right = cursor + self.glyph_set.widths[key]
+                cursor = right + self.char_buff
+            cursor += self.word_buff - self.char_buff
+
+        # Unused slots collapse to a single point at the end of the text rather than holding no points, so a
+        # Transform into or out of the line shrinks them into its end instead of pulling them to the origin
+        for mob in self.submobjects[slot:]:
+            mob.set_points_as_corners([np.array([right, 0, 0])] * 2)
+
+        self.layout_width = self.width
+        if scale_factor != 1.0:
+            self.scale(scale_factor)
+        self.move_to(anchor, aligned_edge=edge)
+        return self
+
+
+class PolynomialEquation(GlyphLine):
+    def __init__(self, coeffs, **kwargs):
+        super().__init__(**kwargs)
+        self.set_coefficients(coeffs)
+
+    def set_coefficients(self, coeffs):
+        # Same formatting as the old MathTex version: "y = -1.23x^{3} + 0.45x^{2} - 0.10x + 2.00"
+        cleaned = [0.0 if abs(c) < 1e-4 else c for c in coeffs]
+        degree = len(cleaned) - 1
+
+        words = [["y"], ["="]]
+        for idx, coeff in enumerate(cleaned):
+            power = degree - idx
+            term = list(f"{abs(coeff):.2f}")
+            if power == 1:
+                term.append("x")
+            elif power > 1:
+                term.append(f"x^{{{power}}}")
+
+            if idx == 0:
+                words.append((["-"] if coeff < 0 else []) + term)
+            else:
+                words.append(["-" if coeff < 0 else "+"])
+                words.append(term)
+
+        return self.set_words(words)
+
+
+class GlyphDecimal(GlyphLine):
+    # Stand-in for DecimalNumber when the value changes every frame: set_value lays the cached digit, sign and
+    # decimal point glyphs out in the slot pool instead of typesetting a new set of digit mobjects
+    def __init__(self, number=0, num_decimal_places=2, font_size=DEFAULT_FONT_SIZE, num_slots=8, edge_to_fix=LEFT, **kwargs):
+        super().__init__(font_size=font_size, num_slots=num_slots, char_buff=0.048, **kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.edge_to_fix = edge_to_fix
+        self.number = number
+        self.set_words([list(self.get_num_string(number))])
+
+    def get_num_string(self, number):
+        num_string = f"{number:.{self.num_decimal_places}f}"
+        # Like DecimalNumber, never show "-0.00"
+        if num_string.startswith("-") and np.round(number, self.num_decimal_places) == 0:
+            num_string = num_string[1:]
+        return num_string
+
+    def set_value(self, number):
+        self.number = number
+        return self.set_words([list(self.get_num_string(number))], edge=self.edge_to_fix)
+
+    def get_value(self):
+        return self.number
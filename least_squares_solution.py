@@ -2,12 +2,16 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
+from encoding import FastEncodingMixin
+from quality import set_quality
+from regression_kernel import LeastSquares
+from svg_cache import enable_svg_point_cache
 
+set_quality()
+enable_svg_point_cache()
 
-class LeastSquaresSolution(Scene):
+
+class LeastSquaresSolution(FastEncodingMixin, Scene):
     def construct(self):
         title = Text("Least-Squares-Solution", font_size=40)
         self.play(Write(title))
@@ -62,8 +66,7 @@ class LeastSquaresSolution(Scene):
         # compute regression line
         x = np.column_stack((np.ones(len(points_array)), points_array[:, 0]))
         y = points_array[:, 1]
-        beta = np.linalg.inv(x.T @ x) @ x.T @ y
-        y_hat = x @ beta
+        y_hat = LeastSquares(x).project(y)
         regression_line = Line(
             start=plane.c2p(points_array[0, 0], y_hat[0]),
             end=plane.c2p(points_array[-1, 0], y_hat[-1]),
@@ -0,0 +1,113 @@
+from manim import *
+import numpy as np
+
+
+def rotation_from_to(u, v):
+    # Rotation matrix taking unit vector u onto unit vector v (Rodrigues)
+    axis = np.cross(u, v)
+    s = np.linalg.norm(axis)
+    c = np.dot(u, v)
+    if s < 1e-9:
+        if c > 0:
+            return np.identity(3)
+        # Antiparallel: half turn about any axis perpendicular to u
+        perp = np.cross(u, RIGHT if abs(u[0]) < 0.9 else UP)
+        perp /= np.linalg.norm(perp)
+        return 2 * np.outer(perp, perp) - np.identity(3)
+    k = axis / s
+    K = np.array([
+        [0, -k[2], k[1]],
+        [k[2], 0, -k[0]],
+        [-k[1], k[0], 0],
+    ])
+    return np.identity(3) + s * K + (1 - c) * (K @ K)
+
+
+class MovableArrow3D(Arrow3D):
+    def __init__(self, start=LEFT, end=RIGHT, height=0.3, **kwargs):
+        super().__init__(start=start, end=end, height=height, **kwargs)
+        self.tip_height = height
+
+        # Reference pose: the mesh is built once here and every later pose is a linear map of these points
+        self.ref_start = np.array(self.start, dtype=float)
+        self.ref_end = self.get_end().copy()
+        self.ref_direction = normalize(self.ref_end - self.ref_start)
+        self.ref_shaft_length = max(np.linalg.norm(self.ref_end - self.ref_start) - height, 1e-6)
+
+        tip_family = set(self.cone.get_family()) | {self.end_point}
+        self.shaft_mobs = [mob for mob in self.get_family() if mob not in tip_family and mob.get_num_points() > 0]
+        self.tip_mobs = [mob for mob in self.get_family() if mob in tip_family and mob.get_num_points() > 0]
+        self.shaft_ref_points = [mob.points.copy() - self.ref_start for mob in self.shaft_mobs]
+        self.tip_ref_points = [mob.points.copy() - self.ref_end for mob in self.tip_mobs]
+
+    def put_start_and_end_on(self, start, end):
+        start = np.array(start, dtype=float)
+        end = np.array(end, dtype=float)
+        vect = end - start
+        length = np.linalg.norm(vect)
+
+        # Keep the last direction while the arrow passes through zero length
+        direction = vect / length if length > 1e-9 else self.direction
+        rotation = rotation_from_to(self.ref_direction, direction)
+
+        # The shaft stretches along its axis, the cone only rotates and moves with the end point
+        stretch = max(length - self.tip_height, 0) / self.ref_shaft_length
+        shaft_matrix = rotation @ (np.identity(3) + (stretch - 1) * np.outer(self.ref_direction, self.ref_direction))
+
+        for mob, ref in zip(self.shaft_mobs, self.shaft_ref_points):
+            mob.set_points(ref @ shaft_matrix.T + start)
+        for mob, ref in zip(self.tip_mobs, self.tip_ref_points):
+            mob.set_points(ref @ rotation.T + end)
+
+        self.start = start
+        self.end = end - self.tip_height * direction
+        self.vect = vect
+        self.length = length
+        self.direction = direction
+        return self
+
+
+def get_affine_parts(axes):
+    # axes.c2p is affine, so probing the origin and the three unit vectors recovers it exactly
+    origin = np.array(axes.c2p(0, 0, 0))
+    matrix = np.column_stack([np.array(axes.c2p(*unit)) - origin for unit in np.identity(3)])
+    return matrix, origin
+
+
+def apply_points_function(mobject, func):
+    # Batched replacement for apply_function: func maps an (N, 3) array of points to an (N, 3) array,
+    # and is called once for the whole family instead of once per point
+    mobs = mobject.family_members_with_points()
+    if not mobs:
+        return mobject
+    split_indices = np.cumsum([mob.get_num_points() for mob in mobs])[:-1]
+    points = func(np.vstack([mob.points for mob in mobs]))
+    for mob, mob_points in zip(mobs, np.split(points, split_indices)):
+        mob.set_points(mob_points)
+    return mobject
+
+
+def apply_affine(mobject, matrix, offset=ORIGIN):
+    # p -> matrix @ p + offset for every point of the family
+    matrix = np.asarray(matrix, dtype=float)
+    return apply_points_function(mobject, lambda points: points @ matrix.T + offset)
+
+
+class SpanPlane(NumberPlane):
+    def __init__(self, axes, basis_u, basis_v, **kwargs):
+        super().__init__(**kwargs)
+        self.c2p_matrix, self.c2p_origin = get_affine_parts(axes)
+
+        # The (u, v) grid is built once; every basis change is a single matrix product over all of its points
+        self.mobs_with_points = self.family_members_with_points()
+        self.uv_points = np.vstack([mob.points[:, :2] for mob in self.mobs_with_points])
+        self.split_indices = np.cumsum([mob.get_num_points() for mob in self.mobs_with_points])[:-1]
+        self.set_basis(basis_u, basis_v)
+
+    def set_basis(self, basis_u, basis_v):
+        # (u, v) -> axes.c2p(u * basis_u + v * basis_v)
+        span_matrix = self.c2p_matrix @ np.column_stack([basis_u, basis_v])
+        points = self.uv_points @ span_matrix.T + self.c2p_origin
+        for mob, mob_points in zip(self.mobs_with_points, np.split(points, self.split_indices)):
+            mob.set_points(mob_points)
+        return self
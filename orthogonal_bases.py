@@ -2,11 +2,16 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
+from encoding import FastEncodingMixin
+from quality import set_quality
+from regression_kernel import project
+from svg_cache import enable_svg_point_cache
+from tex_batch import TexBatchMixin
 
-class OrthogonalBases(Scene):
+set_quality()
+enable_svg_point_cache()
+
+class OrthogonalBases(FastEncodingMixin, TexBatchMixin, Scene):
     def construct(self):
         # The first step to finding the projection of y onto the subspace spanned by 1 and x is to find orthogonal
         # bases for that subspace, or two perpendicular vectors that lie in the subspace.
@@ -34,7 +39,7 @@ class OrthogonalBases(Scene):
         x = np.array([1, 3])
         one = np.array([1, 1])
 
-        proj_one_x = np.dot(x, one) / np.dot(one, one) * one
+        proj_one_x = project(x, one)
 
         x_hat = x - proj_one_x
 
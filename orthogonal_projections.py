@@ -2,11 +2,19 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
-
-class OrthogonalProjections(ThreeDScene):
+from camera_path import PathCameraMixin
+from encoding import FastEncodingMixin
+from mobjects_3d import SpanPlane
+from quality import set_quality
+from regression_kernel import project
+from svg_cache import enable_svg_point_cache
+from tex_batch import TexBatchMixin
+from updaters import UpdaterProfileMixin
+
+set_quality()
+enable_svg_point_cache()
+
+class OrthogonalProjections(FastEncodingMixin, TexBatchMixin, UpdaterProfileMixin, PathCameraMixin, ThreeDScene):
     def construct(self):
         # TODO: AFTER ORTHOGONAL BASES
 
@@ -24,45 +32,41 @@ class OrthogonalProjections(ThreeDScene):
         y = np.array([2.0, 3.0, 7.0])
 
         # proj_1(x) and orthogonal component
-        x_par = (np.dot(x, one) / np.dot(one, one)) * one  # proj_1(x)
+        x_par = project(x, one)  # proj_1(x)
         x_orth = x - x_par  # x - proj_1(x)
 
         # Plane morph parameter: 0 -> span{one, x}, 1 -> span{one, x_orth}
         basis_alpha = ValueTracker(0.0)
 
-        def make_plane():
+        def current_basis_x():
             a = basis_alpha.get_value()
-            basis_x = (1 - a) * x + a * x_orth
-
-            plane = NumberPlane(
-                x_range=[-6, 6, 1],
-                y_range=[-6, 6, 1],
-                background_line_style={
-                    "stroke_color": GREY,
-                    "stroke_width": 1,
-                    "stroke_opacity": 0.35,
-                },
-                axis_config={
-                    "stroke_color": GREY,
-                    "stroke_width": 3,
-                    "stroke_opacity": 0.55,
-                },
-            )
-
-            # Map (u,v) -> u*basis_x + v*one in R^3
-            def map_to_span(p):
-                u, v, _ = p
-                world = u * basis_x + v * one
-                return axes.c2p(*world)
-
-            plane.apply_function(map_to_span)
-            return plane
-
-        plane = always_redraw(make_plane)
+            return (1 - a) * x + a * x_orth
+
+        # The grid is built once; each frame maps (u,v) -> u*basis_x + v*one in R^3 with one matrix product
+        plane = SpanPlane(
+            axes,
+            current_basis_x(),
+            one,
+            x_range=[-6, 6, 1],
+            y_range=[-6, 6, 1],
+            background_line_style={
+                "stroke_color": GREY,
+                "stroke_width": 1,
+                "stroke_opacity": 0.35,
+            },
+            axis_config={
+                "stroke_color": GREY,
+                "stroke_width": 3,
+                "stroke_opacity": 0.55,
+            },
+        )
+        plane.add_updater(lambda mob: mob.set_basis(current_basis_x(), one))
 
         # Camera + ambient rotation
         self.move_camera(phi=60 * DEGREES, theta=-45 * DEGREES, run_time=2)
         self.play(FadeIn(axes))
+        # The axes never move again: project them for a block of frames at a time along the ambient rotation
+        self.add_static_geometry(axes)
         self.begin_ambient_camera_rotation(rate=0.2)
 
         origin = axes.c2p(0, 0, 0)
@@ -90,6 +94,9 @@ class OrthogonalProjections(ThreeDScene):
             TransformFromCopy(x_vec, x_orth_vec),
             run_time=3,
         )
+        # basis_alpha stays at 1 from here on, so the plane has settled
+        plane.clear_updaters()
+        self.add_static_geometry(plane)
         self.wait(4)
 
         # Fade out original x and proj_1(x)
@@ -102,8 +109,8 @@ class OrthogonalProjections(ThreeDScene):
         self.wait(0.2)
 
         # Projections of y onto orthogonal bases: {one, x_orth}
-        y_proj_one = (np.dot(y, one) / np.dot(one, one)) * one
-        y_proj_orth = (np.dot(y, x_orth) / np.dot(x_orth, x_orth)) * x_orth
+        y_proj_one = project(y, one)
+        y_proj_orth = project(y, x_orth)
         y_proj_plane = y_proj_one + y_proj_orth
 
         # Dashed lines from y to each projection
@@ -167,7 +174,7 @@ class OrthogonalProjections(ThreeDScene):
 
 
 def render_manim():
-    command = ["manim", "-p", "--renderer=cairo", "--disable_caching", "--write_to_movie", "orthogonal_projections.py", "OrthogonalProjections"]
+    command = ["manim", "-p", "--renderer=cairo", "--write_to_movie", "orthogonal_projections.py", "OrthogonalProjections"]
     subprocess.run(command)
 
 if __name__ == "__main__":
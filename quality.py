@@ -0,0 +1,29 @@
+import os
+
+# "final" is what every scene used to hard-code. manim names its video folder (and with it the partial movie
+# cache) after height and frame rate, e.g. media/videos/regression_intro/480p15, so the two never share files.
+QUALITIES = {
+    "final": {"pixel_width": 1920, "pixel_height": 1080, "frame_rate": 60},
+    "proxy": {"pixel_width": 854, "pixel_height": 480, "frame_rate": 15},
+}
+
+
+def get_quality():
+    # RENDER_QUALITY=proxy for quick drafts; anything unset renders the final video
+    quality = os.environ.get("RENDER_QUALITY", "final")
+    if quality not in QUALITIES:
+        raise ValueError(f"RENDER_QUALITY must be one of {', '.join(QUALITIES)}, not {quality!r}")
+    return quality
+
+
+def get_quality_dir(quality):
+    values = QUALITIES[quality]
+    return f"{values['pixel_height']}p{values['frame_rate']}"
+
+
+def set_quality():
+    # Called at import time by every scene module, in place of setting the resolution and frame rate directly
+    from manim import config
+
+    for key, value in QUALITIES[get_quality()].items():
+        setattr(config, key, value)
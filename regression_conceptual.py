@@ -2,9 +2,13 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
+from encoding import FastEncodingMixin
+from quality import set_quality
+from svg_cache import enable_svg_point_cache
+from tex_batch import TexBatchMixin
+
+set_quality()
+enable_svg_point_cache()
 
 
 def create_ordered_pair(x, y, x_color, y_color):
@@ -19,7 +23,7 @@ def create_ordered_pair(x, y, x_color, y_color):
     return point
 
 
-class RegressionConceptual(Scene):
+class RegressionConceptual(FastEncodingMixin, TexBatchMixin, Scene):
     def construct(self):
         # AFTER INTRO
         # Now, let's dive into the concepts behind how linear regression is performed.
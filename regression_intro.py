@@ -2,11 +2,18 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
-
-class RegressionIntro(Scene):
+from encoding import FastEncodingMixin
+from glyphs import GlyphDecimal
+from quality import set_quality
+from regression_kernel import PolynomialFitter
+from svg_cache import enable_svg_point_cache
+from tex_batch import TexBatchMixin
+from updaters import UpdaterProfileMixin, memoize_on
+
+set_quality()
+enable_svg_point_cache()
+
+class RegressionIntro(FastEncodingMixin, TexBatchMixin, UpdaterProfileMixin, Scene):
     def construct(self):
         # TODO: Need script for start
         # Welcome to our Linear Algebra final project!
@@ -39,7 +46,8 @@ class RegressionIntro(Scene):
             [11.5, 6.5]
         ])
 
-        slope, intercept = np.polyfit(data_points[:, 0], data_points[:, 1], 1)
+        line_fitter = PolynomialFitter(data_points[:, 0], 1)
+        slope, intercept = line_fitter.fit(data_points[:, 1])
 
         regression_function = lambda x: slope * x + intercept
 
@@ -114,7 +122,7 @@ class RegressionIntro(Scene):
         square_transforms = []
         for error, exponent in zip(errors, error_exponents):
             squared_value = np.round(error.get_value() ** 2, 2)
-            squared_decimal = DecimalNumber(
+            squared_decimal = GlyphDecimal(
                 squared_value,
                 num_decimal_places=2,
                 font_size=24
@@ -159,7 +167,7 @@ class RegressionIntro(Scene):
         self.add(equals_sign)
 
         sse_value = np.round(sum(error.get_value() for error in errors), 2)
-        sse_decimal = DecimalNumber(
+        sse_decimal = GlyphDecimal(
             sse_value,
             num_decimal_places=2,
             font_size=desired_font_size
@@ -196,11 +204,20 @@ class RegressionIntro(Scene):
         def b_of(m_val: float) -> float:
             return y_mean - m_val * x_mean
 
+        # Everything below depends only on m, so compute it once per frame and share it between updaters
+        @memoize_on(m)
+        def current_line(m_val):
+            return m_val, b_of(m_val)
+
+        @memoize_on(m)
+        def current_residuals(m_val):
+            return line_fitter.residuals(data_points[:, 1], [m_val, b_of(m_val)])
+
         # Replace the (static) regression line with a dynamic one
         self.remove(regression_line)
         regression_line_dyn = always_redraw(
             lambda: plane.plot(
-                lambda x: m.get_value() * x + b_of(m.get_value()),
+                lambda x: current_line()[0] * x + current_line()[1],
                 color=WHITE
             )
         )
@@ -210,33 +227,26 @@ class RegressionIntro(Scene):
         self.remove(error_lines)
         error_lines_dyn = VGroup(*[
             always_redraw(
-                lambda p=p: DashedLine(
+                lambda p=p, i=i: DashedLine(
                     plane.c2p(p[0], p[1]),
-                    plane.c2p(p[0], m.get_value() * p[0] + b_of(m.get_value())),
+                    plane.c2p(p[0], p[1] - current_residuals()[i]),
                     dash_length=0.15,
                     color=RED
                 )
             )
-            for p in data_points
+            for i, p in enumerate(data_points)
         ])
         self.add(error_lines_dyn)
 
         # Update each squared error number (the ones at the top)
-        for term, p in zip(errors, data_points):
+        for i, term in enumerate(errors):
             term.add_updater(
-                lambda mob, p=p: mob.set_value(
-                    (p[1] - (m.get_value() * p[0] + b_of(m.get_value()))) ** 2
-                )
+                lambda mob, i=i: mob.set_value(current_residuals()[i] ** 2)
             )
 
         # Update SSE (sum of squared errors)
         sse_decimal.add_updater(
-            lambda mob: mob.set_value(
-                sum(
-                    (p[1] - (m.get_value() * p[0] + b_of(m.get_value()))) ** 2
-                    for p in data_points
-                )
-            )
+            lambda mob: mob.set_value(current_residuals() @ current_residuals())
         )
 
         # Keep the expression nicely laid out as values change width
@@ -0,0 +1,118 @@
+import numpy as np
+
+# The regression geometry every scene shows: projections, Gram-Schmidt and least squares. Vectors are the last
+# axis, so anything that takes one vector (n,) also takes a batch of them (..., n), e.g. one y-vector per frame.
+
+
+def project(v, onto):
+    # proj_onto(v) = (v . onto / onto . onto) onto
+    v = np.asarray(v, dtype=float)
+    onto = np.asarray(onto, dtype=float)
+    return (v @ onto / (onto @ onto))[..., None] * onto
+
+
+def gram_schmidt(*vectors):
+    # Orthogonal (not normalised) vectors spanning the same space, in order: the first vector unchanged, then
+    # x - proj_1(x), ... Taken from a QR factorisation, where each of them is r_kk q_k, rather than by
+    # subtracting projections one at a time
+    q, r = np.linalg.qr(np.column_stack(vectors))
+    return (q * np.diag(r)).T
+
+
+class LeastSquares:
+    def __init__(self, basis):
+        # basis: (n, k), one column per basis vector of the span y is projected onto
+        self.basis = np.asarray(basis, dtype=float)
+
+        # Factor once: coeffs = R^-1 Q^T y, so R^-1 Q^T is the only thing any later fit needs (no inverse of
+        # the normal equations, which squares the condition number)
+        q, r = np.linalg.qr(self.basis)
+        self.solve_matrix = np.linalg.solve(r, q.T)
+
+    def fit(self, y_values):
+        # y_values is one y-vector (n,) or a batch of them (frames, n); the whole batch is one matrix multiply
+        return np.asarray(y_values, dtype=float) @ self.solve_matrix.T
+
+    def predict(self, coeffs):
+        return np.asarray(coeffs, dtype=float) @ self.basis.T
+
+    def project(self, y_values):
+        # y-hat, the closest point to y in the span
+        return self.predict(self.fit(y_values))
+
+    def residuals(self, y_values, coeffs=None):
+        # y - y-hat for the least-squares fit, or for the given coefficients (any line, not just the best one)
+        if coeffs is None:
+            coeffs = self.fit(y_values)
+        return np.asarray(y_values, dtype=float) - self.predict(coeffs)
+
+    def sse(self, y_values, coeffs=None):
+        residuals = self.residuals(y_values, coeffs)
+        return np.sum(residuals * residuals, axis=-1)
+
+
+class PolynomialFitter(LeastSquares):
+    def __init__(self, x_values, degree):
+        self.x_values = np.asarray(x_values, dtype=float)
+        self.degree = degree
+
+        # Vandermonde matrix with the highest power first, same coefficient order as np.polyfit / np.polyval
+        super().__init__(np.vander(self.x_values, degree + 1))
+
+
+def polyfit(x_values, y_values, degree):
+    # np.polyfit through the same QR path
+    return PolynomialFitter(x_values, degree).fit(y_values)
+
+
+class RunningLine:
+    # Least-squares line y = mx + b over a stream of (x, y) chunks without keeping the points. Kept as the count,
+    # means and centred sums of squares/products (Sxx, Sxy, Syy) rather than raw sums (Σx, Σx², ...): the same
+    # sufficient statistics, but merging a chunk doesn't lose precision to cancellation after millions of points
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.sxx = 0.0
+        self.sxy = 0.0
+        self.syy = 0.0
+
+    def add(self, x_values, y_values):
+        # O(chunk) to summarise the chunk, O(1) to merge it in
+        x_values = np.asarray(x_values, dtype=float)
+        y_values = np.asarray(y_values, dtype=float)
+        k = len(x_values)
+        if not k:
+            return self
+        chunk_mean_x = x_values.mean()
+        chunk_mean_y = y_values.mean()
+        dx = x_values - chunk_mean_x
+        dy = y_values - chunk_mean_y
+
+        n = self.n + k
+        shift_x = chunk_mean_x - self.mean_x
+        shift_y = chunk_mean_y - self.mean_y
+        weight = self.n * k / n
+        self.sxx += dx @ dx + shift_x * shift_x * weight
+        self.sxy += dx @ dy + shift_x * shift_y * weight
+        self.syy += dy @ dy + shift_y * shift_y * weight
+        self.mean_x += shift_x * k / n
+        self.mean_y += shift_y * k / n
+        self.n = n
+        return self
+
+    def fit(self):
+        # [slope, intercept], the np.polyfit order
+        if self.sxx == 0:
+            raise ValueError(f"A line needs at least two distinct x values ({self.n} point(s) so far)")
+        slope = self.sxy / self.sxx
+        return np.array([slope, self.mean_y - slope * self.mean_x])
+
+    def sse(self, coeffs=None):
+        # Σ(y - mx - b)² for the least-squares line, or for the given coefficients
+        if coeffs is None:
+            coeffs = self.fit()
+            return max(self.syy - coeffs[0] * self.sxy, 0.0)
+        slope, intercept = coeffs
+        offset = self.mean_y - slope * self.mean_x - intercept
+        return self.syy - 2 * slope * self.sxy + slope * slope * self.sxx + self.n * offset * offset
@@ -2,11 +2,15 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
+from encoding import FastEncodingMixin
+from quality import set_quality
+from svg_cache import enable_svg_point_cache
+from tex_batch import TexBatchMixin
 
-class RegressionMath(Scene):
+set_quality()
+enable_svg_point_cache()
+
+class RegressionMath(FastEncodingMixin, TexBatchMixin, Scene):
     def construct(self):
         intro_text = Text("The Mathematics Behind Linear Regression", font_size=50)
         # Now, let's see how we can put all this knowledge together to actually find a regression line given a set of points mathematically.
@@ -2,12 +2,18 @@ from manim import *
 import numpy as np
 import subprocess
 
-config.pixel_width = 1920
-config.pixel_height = 1080
-config.frame_rate = 60
+from glyphs import GlyphDecimal
+from mobjects_3d import MovableArrow3D, apply_affine, get_affine_parts
+from quality import set_quality
+from regression_kernel import LeastSquares, project
+from svg_cache import enable_svg_point_cache
+from updaters import UpdaterProfileMixin
 
+set_quality()
+enable_svg_point_cache()
 
-class RegressionVisualization(ThreeDScene):
+
+class RegressionVisualization(UpdaterProfileMixin, ThreeDScene):
     def construct(self):
         axes = ThreeDAxes(
             x_range=(-10, 10),
@@ -16,7 +22,7 @@ class RegressionVisualization(ThreeDScene):
         )
         one = np.array([1, 1, 1])
         x = np.array([-3, -2, -1])
-        x_par = (np.dot(x, one) / np.dot(one, one)) * one
+        x_par = project(x, one)
         x_orthog = x - x_par
 
         self.play(FadeIn(axes, run_time=2))
@@ -33,45 +39,19 @@ class RegressionVisualization(ThreeDScene):
         x_scale = ValueTracker(1.0)
         one_scale = ValueTracker(1.0)
 
-        # x vector from origin
-        # x_vector_3d = Arrow3D(
-        #         axes.c2p(0, 0, 0),
-        #         axes.c2p(*x),
-        #         color=RED,
-        # )
-        #
-        # def x_vector_updater(arrow):
-        #     arrow.put_start_and_end_on(
-        #         axes.c2p(0, 0, 0),
-        #         axes.c2p(*(x_scale.get_value() * x)),
-        #         color=RED
-        #     )
-        #
-        # # one vector whose base follows the tip of x
-        # one_vector = Arrow3D(
-        #         axes.c2p(*(x_scale.get_value() * x)),  # base at tip of x
-        #         axes.c2p(*(x_scale.get_value() * x + one_scale.get_value() * one)),  # same direction as 'one'
-        #         color=GREEN,
-        # )
-        #
-        # def one_vector_updater(arrow):
-        #     arrow.put_start_and_end_on(
-        #         axes.c2p(*(x_scale.get_value() * x)),
-        #         axes.c2p(*(x_scale.get_value() * x + one_scale.get_value() * one)),
-        #         color=GREEN,
-        #     )
-        #
-        # x_vector_3d.add_updater(x_vector_updater)
-        # one_vector.add_updater(one_vector_updater)
-
         self.wait(7)
 
         # 12
-        x_vector_3d = always_redraw(
-            lambda: Arrow3D(
+        # Both arrows are built once and then moved by transforming their existing mesh points every frame
+        x_vector_3d = MovableArrow3D(
+            axes.c2p(0, 0, 0),
+            axes.c2p(*x),
+            color=RED,
+        )
+        x_vector_3d.add_updater(
+            lambda arrow: arrow.put_start_and_end_on(
                 axes.c2p(0, 0, 0),
                 axes.c2p(*(x_scale.get_value() * x)),
-                color=RED,
             )
         )
 
@@ -80,11 +60,15 @@ class RegressionVisualization(ThreeDScene):
         # 13
 
         # one vector whose base follows the tip of x
-        one_vector = always_redraw(
-            lambda: Arrow3D(
+        one_vector = MovableArrow3D(
+            axes.c2p(*x),
+            axes.c2p(*(x + one)),
+            color=GREEN,
+        )
+        one_vector.add_updater(
+            lambda arrow: arrow.put_start_and_end_on(
                 axes.c2p(*(x_scale.get_value() * x)),  # base at tip of x
                 axes.c2p(*(x_scale.get_value() * x + one_scale.get_value() * one)),
-                color=GREEN,
             )
         )
 
@@ -106,10 +90,11 @@ class RegressionVisualization(ThreeDScene):
 
         self.add(x_vector_3d, one_vector)
 
-        x_scale_label = DecimalNumber(
+        x_scale_label = GlyphDecimal(
             x_scale.get_value(),
             num_decimal_places=2,
-        ).scale(0.5)
+            font_size=DEFAULT_FONT_SIZE * 0.5,
+        )
 
         def update_x_label(mob):
             tip = x_scale.get_value() * x
@@ -120,10 +105,11 @@ class RegressionVisualization(ThreeDScene):
         x_scale_label.add_updater(update_x_label)
         self.add_fixed_orientation_mobjects(x_scale_label)
 
-        one_scale_label = DecimalNumber(
+        one_scale_label = GlyphDecimal(
             one_scale.get_value(),
             num_decimal_places=2,
-        ).scale(0.5)
+            font_size=DEFAULT_FONT_SIZE * 0.5,
+        )
 
         def update_one_label(mob):
             tip = x_scale.get_value() * x + one_scale.get_value() * one
@@ -255,12 +241,9 @@ class RegressionVisualization(ThreeDScene):
         #                                 x / np.linalg.norm(x),
         #                                 normal / np.linalg.norm(normal)])
         # plane.apply_matrix(basis_matrix)
-        def map_to_span(p):
-            u, v, z = p
-            world = u * x_orthog + v * one      # in R^3
-            return axes.c2p(*world)      # into the scene coords used by axes / Arrow3D / Dot3D
-
-        plane.apply_function(map_to_span)
+        # (u, v, z) -> axes.c2p(u * x_orthog + v * one), applied to every point of the plane in one operation
+        c2p_matrix, c2p_origin = get_affine_parts(axes)
+        apply_affine(plane, c2p_matrix @ np.column_stack([x_orthog, one, ORIGIN]), c2p_origin)
 
         self.play(DrawBorderThenFill(plane), run_time=2)
         self.play(FadeOut(dots, run_time=1))
@@ -278,11 +261,9 @@ class RegressionVisualization(ThreeDScene):
 
         # 46
 
-        # normal to span(x, 1)
-        normal = np.cross(one, x)
-        normal_unit = normal / np.linalg.norm(normal)
-
-        proj_y = y - np.dot(y, normal_unit) * normal_unit
+        # Closest point to y in span(x, 1)
+        span = LeastSquares(np.column_stack([x, one]))
+        proj_y = span.project(y)
 
         proj_line = DashedLine(
             axes.c2p(*y),
@@ -303,8 +284,7 @@ class RegressionVisualization(ThreeDScene):
         # 55
 
         # Move the vectors x, 1 to the projection point
-        A = np.column_stack([x, one])
-        (a, b), *_ = np.linalg.lstsq(A, proj_y, rcond=None)
+        a, b = span.fit(proj_y)
 
         # 60
 
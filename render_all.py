@@ -0,0 +1,313 @@
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from quality import get_quality_dir
+
+ROOT = Path(__file__).resolve().parent
+
+# Order the scenes appear in the video
+VIDEO_ORDER = [
+    "RegressionIntro",
+    "RegressionConceptual",
+    "RegressionVisualization",
+    "OrthogonalBases",
+    "OrthogonalProjections",
+    "RegressionMath",
+    "ExtendedRegression",
+    "LeastSquaresSolution",
+    "Conclusion",
+]
+
+SCENE_BASES = {"Scene", "ThreeDScene", "MovingCameraScene"}
+
+
+def get_render_flags(tree):
+    # Reuse the flags from the module's own render_manim() command (renderer, caching, ...), minus the preview
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == "render_manim":
+            for sub in ast.walk(node):
+                if isinstance(sub, ast.List) and sub.elts and getattr(sub.elts[0], "value", None) == "manim":
+                    args = [elt.value for elt in sub.elts[1:] if isinstance(elt, ast.Constant)]
+                    flags = [arg for arg in args if arg.startswith("-") and arg != "-p"]
+                    # Without -p the OpenGL renderer only writes a file when asked to
+                    if "--renderer=opengl" in flags and "--write_to_movie" not in flags:
+                        flags.append("--write_to_movie")
+                    return flags
+    return ["--renderer=cairo"]
+
+
+def discover_scenes():
+    scenes = []
+    for path in sorted(ROOT.glob("*.py")):
+        tree = ast.parse(path.read_text())
+        flags = get_render_flags(tree)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and any(getattr(base, "id", None) in SCENE_BASES for base in node.bases):
+                # Only scenes that are part of the video; demos like StreamingRegression render on their own
+                if node.name in VIDEO_ORDER:
+                    scenes.append((path.name, node.name, flags))
+
+    return sorted(scenes, key=lambda scene: VIDEO_ORDER.index(scene[1]))
+
+
+def get_renderer(flags):
+    for flag in flags:
+        if flag.startswith("--renderer="):
+            return flag.split("=", 1)[1]
+    return "cairo"
+
+
+def get_env(quality, flags=(), gl_threads=None):
+    # Scene modules read RENDER_QUALITY at import (quality.set_quality), so it is passed down to every manim run
+    env = {**os.environ, "RENDER_QUALITY": quality}
+    if gl_threads and "--renderer=opengl" in flags:
+        # Offscreen software OpenGL. With no display to connect to, manim's standalone context falls back to EGL,
+        # and Mesa's surfaceless platform with llvmpipe needs neither a GPU nor a window system. llvmpipe
+        # rasterizes on every core by default, so each concurrent worker is held to its share.
+        env.pop("DISPLAY", None)
+        env.pop("WAYLAND_DISPLAY", None)
+        env.update({
+            "EGL_PLATFORM": "surfaceless",
+            "LIBGL_ALWAYS_SOFTWARE": "1",
+            "GALLIUM_DRIVER": "llvmpipe",
+            "LP_NUM_THREADS": str(gl_threads),
+        })
+    return env
+
+
+def render_scene(file_name, scene_name, flags, extra_flags=(), quality="final", gl_threads=None):
+    command = ["manim", *flags, *extra_flags, file_name, scene_name]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, env=get_env(quality, flags, gl_threads))
+    return scene_name, result.returncode, time.perf_counter() - start, result.stderr
+
+
+def count_animations(file_name, scene_name, flags=(), quality="final", gl_threads=None):
+    # Run construct() with every animation skipped and no movie written, then read the renderer's play counter.
+    # Done in a fresh interpreter because manim's config is global, and with the renderer the scene is rendered
+    # with: the OpenGL and Cairo renderers don't count play calls the same way
+    code = (
+        "import importlib\n"
+        "from manim import config\n"
+        f"config.renderer = {get_renderer(flags)!r}\n"
+        "config.write_to_movie = False\n"
+        "config.from_animation_number = 10 ** 9\n"
+        f"scene = getattr(importlib.import_module({Path(file_name).stem!r}), {scene_name!r})()\n"
+        "scene.render()\n"
+        "print(scene.renderer.num_plays)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, env=get_env(quality, flags, gl_threads)
+    )
+    num_plays = int(result.stdout.split()[-1]) if result.returncode == 0 else None
+    return scene_name, result.returncode, num_plays, result.stderr
+
+
+def split_ranges(num_plays, segments):
+    # Contiguous, inclusive (first, last) play-index ranges of roughly equal length
+    bounds = [round(i * num_plays / segments) for i in range(segments + 1)]
+    return [(first, last - 1) for first, last in zip(bounds, bounds[1:]) if last > first]
+
+
+def render_segment(
+    file_name, scene_name, flags, index, first, last, config_dir, extra_flags=(), quality="final", gl_threads=None
+):
+    # Each segment gets its own partial movie directory so workers never share a partial_movie_file_list.txt
+    config_file = Path(config_dir) / f"{scene_name}_segment_{index:02d}.cfg"
+    config_file.write_text(
+        "[CLI]\n"
+        f"partial_movie_dir = {{video_dir}}/partial_movie_files/{{scene_name}}/segment_{index:02d}\n"
+    )
+    output_name = f"{scene_name}_segment_{index:02d}"
+    command = [
+        "manim", *flags, *extra_flags,
+        "--config_file", str(config_file),
+        "-n", f"{first},{last}",
+        "-o", output_name,
+        file_name, scene_name,
+    ]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, env=get_env(quality, flags, gl_threads))
+    return output_name, result.returncode, time.perf_counter() - start, result.stderr
+
+
+def find_movie(file_name, output_name, quality="final"):
+    # Drafts and finals of the same scene live side by side, in folders named after the quality
+    return ROOT / "media" / "videos" / Path(file_name).stem / get_quality_dir(quality) / f"{output_name}.mp4"
+
+
+def count_frames(movie_file):
+    import av
+
+    with av.open(str(movie_file)) as container:
+        return container.streams.video[0].frames
+
+
+def concat_movies(input_files, output_file):
+    # Same stream copy manim uses to join its partial movie files, so nothing is re-encoded
+    import av
+
+    list_file = output_file.with_suffix(".txt")
+    list_file.write_text("".join(f"file 'file:{Path(path).as_posix()}'\n" for path in input_files))
+    with av.open(str(list_file), options={"safe": "0"}, format="concat") as source:
+        with av.open(str(output_file), mode="w") as target:
+            source_stream = source.streams.video[0]
+            target_stream = target.add_stream(template=source_stream)
+            for packet in source.demux(source_stream):
+                if packet.dts is None:
+                    continue
+                packet.dts = None
+                packet.stream = target_stream
+                target.mux(packet)
+    list_file.unlink()
+
+
+def render_split(pool, scenes, segments, extra_flags=(), quality="final", gl_threads=None):
+    # Every scene is cut into `segments` runs of consecutive play calls (manim's -n first,last). Each worker
+    # replays construct() with the earlier animations skipped, which rebuilds the scene state at its boundary.
+    timings = {}
+    failed = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        # A scene that fails here is reported like a failed render, and the others go on
+        counts = {}
+        for scene_name, returncode, num_plays, stderr in pool.map(
+            lambda scene: count_animations(*scene, quality, gl_threads), scenes
+        ):
+            if returncode == 0:
+                counts[scene_name] = num_plays
+            else:
+                failed.append(scene_name)
+                print(f"{scene_name:<36} {'':9}  FAILED ({returncode}) counting play calls", flush=True)
+                print(stderr[-2000:])
+
+        futures = {}
+        whole = {}
+        for file_name, scene_name, flags in scenes:
+            if scene_name not in counts:
+                continue
+            if counts[scene_name] == 0:
+                # Nothing to split (no play calls, only a still frame): one ordinary run
+                future = pool.submit(render_scene, file_name, scene_name, flags, extra_flags, quality, gl_threads)
+                whole[future] = scene_name
+                continue
+            for index, (first, last) in enumerate(split_ranges(counts[scene_name], segments)):
+                future = pool.submit(
+                    render_segment,
+                    file_name, scene_name, flags, index, first, last, config_dir, extra_flags, quality, gl_threads,
+                )
+                futures[future] = scene_name
+
+        segment_names = {scene[1]: [] for scene in scenes}
+        segment_seconds = {scene[1]: 0.0 for scene in scenes}
+        for future in as_completed([*futures, *whole]):
+            output_name, returncode, seconds, stderr = future.result()
+            status = "ok" if returncode == 0 else f"FAILED ({returncode})"
+            print(f"{output_name:<36} {seconds:8.1f}s  {status}", flush=True)
+            if future in whole:
+                scene_name = whole[future]
+                if returncode == 0:
+                    timings[scene_name] = seconds
+            else:
+                scene_name = futures[future]
+                segment_names[scene_name].append(output_name)
+                segment_seconds[scene_name] += seconds
+            if returncode != 0:
+                failed.append(scene_name)
+                print(stderr[-2000:])
+
+        for file_name, scene_name, _ in scenes:
+            if scene_name in failed or not segment_names[scene_name]:
+                continue
+            movies = [find_movie(file_name, name, quality) for name in sorted(segment_names[scene_name])]
+            concat_movies(movies, movies[0].with_name(f"{scene_name}.mp4"))
+            timings[scene_name] = segment_seconds[scene_name]
+            print(f"{scene_name:<36} {timings[scene_name]:8.1f}s  joined {len(movies)} segments", flush=True)
+
+    return timings, failed
+
+
+def render_all(scene_names=None, jobs=None, segments=1, extra_flags=(), quality="final", headless=False):
+    scenes = discover_scenes()
+    if scene_names:
+        scenes = [scene for scene in scenes if scene[1] in scene_names]
+    jobs = jobs or os.cpu_count() or 1
+    gl_threads = max(1, (os.cpu_count() or 1) // jobs) if headless else None
+
+    start = time.perf_counter()
+    timings = {}
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        if segments > 1:
+            timings, failed = render_split(pool, scenes, segments, extra_flags, quality, gl_threads)
+        else:
+            futures = {pool.submit(render_scene, *scene, extra_flags, quality, gl_threads): scene for scene in scenes}
+            for future in as_completed(futures):
+                scene_name, returncode, seconds, stderr = future.result()
+                timings[scene_name] = seconds
+                if returncode == 0:
+                    # Throughput of the worker that rendered this scene, comparable across renderers and settings
+                    frames = count_frames(find_movie(futures[future][0], scene_name, quality))
+                    status = f"ok  {frames} frames, {frames / seconds:.1f} frames/s"
+                else:
+                    status = f"FAILED ({returncode})"
+                print(f"{scene_name:<26} {seconds:8.1f}s  {status}", flush=True)
+                if returncode != 0:
+                    failed.append(scene_name)
+                    print(stderr[-2000:])
+
+    print(f"{'total wall time':<26} {time.perf_counter() - start:8.1f}s  (sum of scenes: {sum(timings.values()):.1f}s)")
+    return timings, failed
+
+
+def promote(scene_names=(), jobs=None, segments=1, headless=False):
+    # Render the same scenes at final quality in a detached process, so drafting can go on meanwhile. Play calls
+    # whose final-quality partial movie is already cached are reused, so only what changed is drawn again.
+    log_file = ROOT / "media" / "promote.log"
+    log_file.parent.mkdir(exist_ok=True)
+    command = [sys.executable, str(Path(__file__).resolve()), *scene_names, "--segments", str(segments)]
+    if jobs:
+        command += ["--jobs", str(jobs)]
+    if headless:
+        command.append("--headless")
+    with open(log_file, "w") as log:
+        process = subprocess.Popen(
+            command, cwd=ROOT, stdout=log, stderr=subprocess.STDOUT, start_new_session=True, env=get_env("final")
+        )
+    print(f"Rendering final quality in the background (pid {process.pid}), log in {log_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every scene of the video in parallel.")
+    parser.add_argument("scenes", nargs="*", help="Scene class names to render (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of manim processes at once (default: CPU count)")
+    parser.add_argument("--segments", type=int, default=1, help="Split each scene into this many runs of play calls rendered in parallel")
+    parser.add_argument("--stream", action="store_true", help="Encode each scene in one pass without partial movie files (no partial movie cache)")
+    parser.add_argument("--headless", action="store_true", help="Render OpenGL scenes offscreen with software OpenGL (EGL surfaceless, llvmpipe)")
+    parser.add_argument("--proxy", action="store_true", help="Render low-resolution drafts (480p15) instead of the final 1080p60")
+    parser.add_argument("--promote", action="store_true", help="Start a background final-quality render (after the drafts, with --proxy)")
+    args = parser.parse_args()
+
+    if args.promote and not args.proxy:
+        promote(args.scenes, args.jobs, args.segments, args.headless)
+        return
+
+    extra_flags = ["--disable_caching"] if args.stream else []
+    _, failed = render_all(
+        args.scenes, args.jobs, args.segments, extra_flags,
+        quality="proxy" if args.proxy else "final",
+        headless=args.headless,
+    )
+    if args.promote and not failed:
+        promote(args.scenes, args.jobs, args.segments, args.headless)
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from manim import *
+import hashlib
+import numpy as np
+
+from updaters import TrackerMemo
+
+
+def add_mobject(digest, mobject):
+    for mob in mobject.get_family():
+        digest.update(type(mob).__name__.encode())
+        data = getattr(mob, "data", None)
+        if isinstance(data, dict):
+            arrays = [data[key] for key in sorted(data)]
+        else:
+            arrays = [mob.points] + [
+                getattr(mob, attr) for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+                if hasattr(mob, attr)
+            ]
+        for array in arrays:
+            digest.update(np.ascontiguousarray(array, dtype=float).tobytes())
+        pixel_array = getattr(mob, "pixel_array", None)
+        if isinstance(pixel_array, np.ndarray):
+            # ImageMobject: the image is its content, the points only place it
+            digest.update(repr(pixel_array.shape).encode())
+            digest.update(np.ascontiguousarray(pixel_array).tobytes())
+        digest.update(repr((getattr(mob, "stroke_width", None), mob.z_index)).encode())
+        for updater in mob.get_updaters():
+            add_function(digest, updater)
+
+
+def add_value(digest, value, depth):
+    if isinstance(value, TrackerMemo):
+        # Callable too, so it has to come before the function case: both the memoized function (with whatever it
+        # captured) and the trackers it reads are inputs
+        add_function(digest, value.func, depth + 1)
+        for tracker in value.trackers:
+            digest.update(np.asarray(tracker.get_value(), dtype=float).tobytes())
+    elif isinstance(value, (int, float, str, bool, type(None))):
+        digest.update(repr(value).encode())
+    elif isinstance(value, np.ndarray):
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)) and depth < 3:
+        for item in value:
+            add_value(digest, item, depth + 1)
+    elif isinstance(value, Mobject):
+        # Trackers and other mobjects an updater reads from: their current state is an input to its output
+        for mob in value.get_family():
+            digest.update(np.ascontiguousarray(mob.points, dtype=float).tobytes())
+    elif callable(value) and depth < 3:
+        add_function(digest, value, depth + 1)
+
+
+def add_function(digest, func, depth=0):
+    func = getattr(func, "__func__", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        digest.update(getattr(func, "__qualname__", type(func).__name__).encode())
+        return
+    digest.update(code.co_code)
+    digest.update(repr([const for const in code.co_consts if not hasattr(const, "co_code")]).encode())
+    # Default arguments carry per-updater state in this repo, e.g. lambda mob, i=i: ...
+    add_value(digest, list(func.__defaults__ or ()), depth)
+    add_value(digest, sorted((func.__kwdefaults__ or {}).items()), depth)
+    for cell in func.__closure__ or ():
+        try:
+            add_value(digest, cell.cell_contents, depth)
+        except ValueError:
+            # Empty cell (closure variable not assigned yet)
+            pass
+
+
+def add_animation(digest, animation):
+    digest.update(type(animation).__name__.encode())
+    digest.update(repr((animation.run_time, animation.lag_ratio)).encode())
+    add_function(digest, animation.rate_func)
+    add_mobject(digest, animation.mobject)
+    target = getattr(animation, "target_mobject", None)
+    if target is not None:
+        add_mobject(digest, target)
+    for child in getattr(animation, "animations", ()):
+        add_animation(digest, child)
+
+
+def scene_state_digest(scene):
+    # Key for one play/wait: the state of everything on screen as it is, every updater's code and inputs
+    # (tracker values, captured constants), the animations with their end states and timing, and the camera.
+    # Updater outputs over the segment are a function of these, so equal keys give equal frames. Hashing must
+    # not run the updaters itself: that would be an extra update (and always_redraw rebuild) before every play.
+    digest = hashlib.sha1()
+    for mobject in list_update(scene.mobjects, scene.foreground_mobjects):
+        add_mobject(digest, mobject)
+    for animation in scene.animations:
+        add_animation(digest, animation)
+
+    camera = scene.renderer.camera
+    for attr in ("phi_tracker", "theta_tracker", "gamma_tracker", "focal_distance_tracker", "zoom_tracker"):
+        if hasattr(camera, attr):
+            add_mobject(digest, getattr(camera, attr))
+    digest.update(repr((config.pixel_width, config.pixel_height, config.frame_rate)).encode())
+    return digest.hexdigest()[:16]
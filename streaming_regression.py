@@ -0,0 +1,206 @@
+from manim import *
+import numpy as np
+import os
+import subprocess
+from itertools import islice
+from pathlib import Path
+
+from encoding import FastEncodingMixin
+from glyphs import GlyphDecimal
+from quality import set_quality
+from regression_kernel import RunningLine
+from svg_cache import enable_svg_point_cache
+from tex_batch import TexBatchMixin
+from updaters import UpdaterProfileMixin
+
+set_quality()
+enable_svg_point_cache()
+
+CHUNK_SIZE = 50_000
+DENSITY_BINS = (240, 150)
+
+
+def get_dataset_path():
+    # REGRESSION_DATA=points.csv (or .npy) with x and y in the first two columns; unset, a synthetic
+    # two-million-point dataset is written once and streamed instead
+    path = os.environ.get("REGRESSION_DATA")
+    if path:
+        return Path(path)
+    path = Path(config.get_dir("media_dir")) / "datasets" / "synthetic_regression.npy"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 10, 2_000_000)
+        y = 0.6 * x + 1 + rng.normal(0, 1.2, len(x)) * (0.5 + x / 10)
+        np.save(path, np.column_stack([x, y]).astype(np.float32))
+    return path
+
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE):
+    # (k, 2) float arrays of x, y; a .npy is memory-mapped and sliced, a CSV is parsed chunk_size lines at a time
+    path = Path(path)
+    if path.suffix == ".npy":
+        data = np.load(path, mmap_mode="r")
+        for start in range(0, len(data), chunk_size):
+            yield np.asarray(data[start:start + chunk_size, :2], dtype=float)
+        return
+
+    with open(path) as file:
+        first = file.readline()
+        try:
+            float(first.split(",")[0])
+            lines = [first]
+        except ValueError:
+            lines = []  # header row
+        lines += list(islice(file, chunk_size - len(lines)))
+        while lines:
+            yield np.loadtxt(lines, delimiter=",", usecols=(0, 1), ndmin=2)
+            lines = list(islice(file, chunk_size))
+
+
+def get_extent(path):
+    # One pass before the scene: the number of chunks and the data's bounding box, for the axes and the bins
+    num_chunks = 0
+    low = np.full(2, np.inf)
+    high = np.full(2, -np.inf)
+    for chunk in iter_chunks(path):
+        num_chunks += 1
+        low = np.minimum(low, chunk.min(axis=0))
+        high = np.maximum(high, chunk.max(axis=0))
+    if not num_chunks:
+        raise ValueError(f"{path} has no data points")
+    if not np.all(np.isfinite(low)) or not np.all(np.isfinite(high)):
+        raise ValueError(f"{path} has missing or non-finite values")
+    if low[0] == high[0]:
+        raise ValueError(f"Every point in {path} has x = {low[0]:g}, so there is no regression line to fit")
+    return num_chunks, low, high
+
+
+def nice_range(low, high, ticks=5):
+    if low == high:
+        # A constant column (e.g. y for a flat line) still needs a visible axis
+        low, high = low - 1, high + 1
+    step = 10 ** np.floor(np.log10((high - low) / ticks))
+    return [np.floor(low / step) * step, np.ceil(high / step) * step, step]
+
+
+class StreamingRegression(FastEncodingMixin, TexBatchMixin, UpdaterProfileMixin, Scene):
+    def construct(self):
+        # The same regression line as in the intro, but for a dataset far too big for one Dot per point: the
+        # points are read in chunks, the line only needs the running sums, and the cloud is drawn as a density
+        path = get_dataset_path()
+        num_chunks, low, high = get_extent(path)
+        x_range = nice_range(low[0], high[0])
+        y_range = nice_range(low[1], high[1])
+
+        plane = NumberPlane(
+            x_range=x_range,
+            y_range=y_range,
+            x_length=9.5,
+            y_length=6.5,
+            background_line_style={
+                "stroke_color": GREY,
+                "stroke_width": 1,
+                "stroke_opacity": 0.4,
+            },
+            axis_config={"stroke_width": 3},
+        ).shift(RIGHT * 1.6)
+        self.play(DrawBorderThenFill(plane), run_time=2)
+
+        # Point counts per bin, accumulated chunk by chunk and shown as one image over the plane
+        counts = np.zeros(DENSITY_BINS)
+        density_color = np.array(color_to_rgb(YELLOW)) * 255
+
+        def density_pixels():
+            alpha = np.log1p(counts) / max(np.log1p(counts.max()), 1)
+            pixels = np.zeros((*counts.T.shape, 4), dtype=np.uint8)
+            pixels[..., :3] = density_color
+            pixels[..., 3] = 255 * alpha.T[::-1]  # image rows run top to bottom
+            return pixels
+
+        density = ImageMobject(density_pixels())
+        bottom_left = plane.c2p(x_range[0], y_range[0])
+        top_right = plane.c2p(x_range[1], y_range[1])
+        density.stretch_to_fit_width(top_right[0] - bottom_left[0])
+        density.stretch_to_fit_height(top_right[1] - bottom_left[1])
+        density.move_to((bottom_left + top_right) / 2)
+
+        stats = RunningLine()
+        chunks = iter_chunks(path)
+        chunks_loaded = ValueTracker(0)
+
+        loaded = [0]
+
+        def load_chunks(mob):
+            # Reads whatever the tracker has reached since the last frame; each chunk is merged into the sums in
+            # O(1) and binned into the counts, then dropped
+            target = int(chunks_loaded.get_value())
+            if target <= loaded[0]:
+                return
+            while loaded[0] < target:
+                chunk = next(chunks)
+                stats.add(chunk[:, 0], chunk[:, 1])
+                counts[...] += np.histogram2d(
+                    chunk[:, 0], chunk[:, 1], bins=DENSITY_BINS, range=[x_range[:2], y_range[:2]]
+                )[0]
+                loaded[0] += 1
+            mob.pixel_array = density_pixels()
+
+        # Start from enough chunks for a line to draw (x can be constant within a chunk of sorted data, but
+        # get_extent made sure it isn't over the whole file)
+        while stats.sxx == 0:
+            chunks_loaded.increment_value(1)
+            load_chunks(density)
+        self.play(FadeIn(density), run_time=1.5)
+
+        def line_points():
+            slope, intercept = stats.fit()
+            return (
+                plane.c2p(x_range[0], slope * x_range[0] + intercept),
+                plane.c2p(x_range[1], slope * x_range[1] + intercept),
+            )
+
+        regression_line = Line(*line_points(), color=WHITE, stroke_width=4)
+        self.play(Create(regression_line), run_time=1.5)
+
+        # Readouts: glyphs are typeset once and only moved around as the values change
+        font_size = 0.8 * DEFAULT_FONT_SIZE
+        labels = VGroup(
+            MathTex("n =", font_size=font_size),
+            MathTex("m =", font_size=font_size),
+            MathTex("b =", font_size=font_size),
+            MathTex("SSE =", font_size=font_size),
+        ).arrange(DOWN, aligned_edge=RIGHT, buff=0.35).to_corner(UL)
+        n_value = GlyphDecimal(stats.n, num_decimal_places=0, font_size=font_size, num_slots=10)
+        slope_value = GlyphDecimal(stats.fit()[0], num_decimal_places=3, font_size=font_size)
+        intercept_value = GlyphDecimal(stats.fit()[1], num_decimal_places=3, font_size=font_size)
+        sse_value = GlyphDecimal(stats.sse(), num_decimal_places=1, font_size=font_size, num_slots=14)
+        values = VGroup(n_value, slope_value, intercept_value, sse_value)
+        for label, value in zip(labels, values):
+            value.next_to(label, RIGHT, buff=0.2)
+        self.play(FadeIn(labels), FadeIn(values), run_time=1)
+
+        density.add_updater(load_chunks)
+        regression_line.add_updater(lambda mob: mob.put_start_and_end_on(*line_points()))
+        n_value.add_updater(lambda mob: mob.set_value(stats.n))
+        slope_value.add_updater(lambda mob: mob.set_value(stats.fit()[0]))
+        intercept_value.add_updater(lambda mob: mob.set_value(stats.fit()[1]))
+        sse_value.add_updater(lambda mob: mob.set_value(stats.sse()))
+
+        # Stream the rest of the file in
+        self.play(chunks_loaded.animate.set_value(num_chunks), run_time=12, rate_func=linear)
+        self.wait(3)
+
+        for mob in [density, regression_line, *values]:
+            mob.clear_updaters()
+        self.play(FadeOut(density, regression_line, labels, values, plane), run_time=1)
+        self.wait(1)
+
+
+def render_manim():
+    command = ["manim", "-p", "--renderer=cairo", "streaming_regression.py", "StreamingRegression"]
+    subprocess.run(command)
+
+
+if __name__ == "__main__":
+    render_manim()
@@ -0,0 +1,81 @@
+from manim import *
+from manim.mobject.opengl.opengl_vectorized_mobject import OpenGLVMobject
+import hashlib
+import os
+import tempfile
+import numpy as np
+from pathlib import Path
+
+parse_svg = SVGMobject.generate_mobject
+
+
+def get_vmobject_class():
+    # Plain VMobject for cairo; under --renderer=opengl groups only accept OpenGLVMobject submobjects
+    return OpenGLVMobject if config.renderer == RendererType.OPENGL else VMobject
+
+
+def get_points_dir():
+    # Not inside tex_dir: manim deletes every file there that isn't .svg or .tex after each LaTeX run
+    path = Path(config.get_dir("media_dir")) / "svg_points"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_points_path(svg_mobject):
+    # Same inputs as manim's in-memory SVG cache (file, default style, path options, renderer), plus the svg's
+    # modification time so a regenerated file is never served stale points
+    svg_file = svg_mobject.get_file_path()
+    seed = (svg_mobject.hash_seed, svg_file.stat().st_mtime_ns)
+    return get_points_dir() / f"{hashlib.sha1(repr(seed).encode()).hexdigest()[:16]}.npz"
+
+
+def save_npz(path, **arrays):
+    # Written next to the final file and renamed into place, so a parallel worker never reads a half-written one
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.stem, suffix=".tmp", delete=False) as file:
+        np.savez(file, **arrays)
+    os.replace(file.name, path)
+
+
+def save_points(path, mobjects):
+    save_npz(
+        path,
+        point_counts=np.array([len(mob.points) for mob in mobjects], dtype=np.int64),
+        points=np.vstack([mob.points for mob in mobjects]).astype(np.float32),
+        fills=np.array([[*mob.get_fill_color().to_rgb(), mob.get_fill_opacity()] for mob in mobjects]),
+        strokes=np.array([[*mob.get_stroke_color().to_rgb(), mob.get_stroke_opacity()] for mob in mobjects]),
+        stroke_widths=np.array([mob.get_stroke_width() for mob in mobjects], dtype=float),
+    )
+
+
+def load_points(path):
+    with np.load(path) as data:
+        point_arrays = np.split(data["points"].astype(float), np.cumsum(data["point_counts"])[:-1])
+        fills = data["fills"]
+        strokes = data["strokes"]
+        stroke_widths = data["stroke_widths"]
+    vmobject_class = get_vmobject_class()
+    mobjects = []
+    for points, fill, stroke, stroke_width in zip(point_arrays, fills, strokes, stroke_widths):
+        mob = vmobject_class()
+        mob.set_points(points)
+        mob.set_fill(ManimColor(fill[:3]), opacity=fill[3])
+        mob.set_stroke(ManimColor(stroke[:3]), width=stroke_width, opacity=stroke[3])
+        mobjects.append(mob)
+    return mobjects
+
+
+def generate_mobject_cached(self):
+    # Second tier under manim's per-process SVG cache: the parsed (and already y-flipped) paths of every svg are
+    # kept on disk, so later runs skip the XML and path-data parsing and only load the point arrays
+    path = get_points_path(self)
+    if path.exists():
+        self.add(*load_points(path))
+        return
+    parse_svg(self)
+    if self.submobjects:
+        save_points(path, self.submobjects)
+
+
+def enable_svg_point_cache():
+    # Call at import time, like the config settings; affects every MathTex, Tex, Text and DecimalNumber after it
+    SVGMobject.generate_mobject = generate_mobject_cached
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from benchmark import time_calls
+
+
+class FakeScene:
+    def __init__(self):
+        self.renderer = SimpleNamespace(time=0.0)
+
+    def play(self, run_time=1.0):
+        self.renderer.time += run_time
+
+    def wait(self, duration=1.0):
+        # Like Scene.wait, which plays a Wait animation
+        self.play(run_time=duration)
+
+
+def test_time_calls_records_only_the_outermost_call():
+    scene = FakeScene()
+    calls = []
+    started = []
+    time_calls(scene, calls, on_start=lambda call, frame: started.append(frame.f_code.co_name))
+    scene.play(2.0)
+    scene.wait(0.5)
+
+    assert [(call["kind"], call["start"], call["duration"]) for call in calls] == [("play", 0.0, 2.0), ("wait", 2.0, 0.5)]
+    assert [call["index"] for call in calls] == [0, 1]
+    assert started == ["test_time_calls_records_only_the_outermost_call"] * 2
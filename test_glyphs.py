@@ -0,0 +1,38 @@
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from manim.mobject.opengl.opengl_vectorized_mobject import OpenGLVMobject
+
+import glyphs
+
+
+@pytest.fixture(params=["cairo", "opengl"])
+def renderer(request, monkeypatch):
+    # Placeholder glyphs, so no LaTeX run; only the mobject types and the layout are under test
+    monkeypatch.setattr(glyphs, "_glyph_sets", {})
+    monkeypatch.setattr(
+        glyphs,
+        "get_glyph_set",
+        lambda font_size=manim.DEFAULT_FONT_SIZE: glyphs.GlyphSet(font_size=font_size, placeholder=True),
+    )
+    with manim.tempconfig({"renderer": request.param}):
+        yield request.param
+
+
+def test_glyph_decimal_builds_with_the_renderers_vmobjects(renderer):
+    decimal = glyphs.GlyphDecimal(1.25, num_decimal_places=2)
+    vmobject_class = OpenGLVMobject if renderer == "opengl" else manim.VMobject
+    assert all(isinstance(mob, vmobject_class) for mob in decimal.submobjects)
+
+    # Inside a group of the same renderer, as the scenes use it
+    manim.VGroup(decimal)
+    decimal.set_value(-12.5)
+    assert decimal.get_value() == -12.5
+
+
+def test_glyph_decimal_keeps_its_scale(renderer):
+    decimal = glyphs.GlyphDecimal(1.25, num_decimal_places=2).scale(2)
+    height = decimal.height
+    decimal.set_value(7.75)
+    assert decimal.height == pytest.approx(height)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from regression_kernel import LeastSquares, PolynomialFitter, RunningLine, gram_schmidt, polyfit, project
+
+rng = np.random.default_rng(0)
+
+
+def test_polynomial_fitter_matches_polyfit():
+    x = np.linspace(-4, 4, 9)
+    y = rng.normal(size=9)
+    fitter = PolynomialFitter(x, 3)
+    np.testing.assert_allclose(fitter.fit(y), np.polyfit(x, y, 3), atol=1e-10)
+    np.testing.assert_allclose(polyfit(x, y, 1), np.polyfit(x, y, 1), atol=1e-10)
+
+
+def test_polynomial_fitter_batch():
+    # One row of coefficients per y-vector, same as fitting each row on its own
+    x = np.linspace(-4, 4, 9)
+    ys = rng.normal(size=(5, 9))
+    fitter = PolynomialFitter(x, 2)
+    np.testing.assert_allclose(fitter.fit(ys), [np.polyfit(x, y, 2) for y in ys], atol=1e-10)
+
+
+def test_least_squares_matches_lstsq():
+    basis = rng.normal(size=(12, 3))
+    y = rng.normal(size=12)
+    coeffs = np.linalg.lstsq(basis, y, rcond=None)[0]
+    least_squares = LeastSquares(basis)
+    np.testing.assert_allclose(least_squares.fit(y), coeffs, atol=1e-10)
+    np.testing.assert_allclose(least_squares.project(y), basis @ coeffs, atol=1e-10)
+    np.testing.assert_allclose(least_squares.residuals(y), y - basis @ coeffs, atol=1e-10)
+    np.testing.assert_allclose(least_squares.sse(y), np.sum((y - basis @ coeffs) ** 2), atol=1e-10)
+
+
+def test_residuals_are_orthogonal_to_the_span():
+    basis = rng.normal(size=(12, 3))
+    ys = rng.normal(size=(4, 12))
+    np.testing.assert_allclose(LeastSquares(basis).residuals(ys) @ basis, 0, atol=1e-10)
+
+
+def test_project_onto_vector():
+    one = np.array([1.0, 1.0, 1.0])
+    x = np.array([-3.0, -2.0, -1.0])
+    np.testing.assert_allclose(project(x, one), [-2, -2, -2])
+    np.testing.assert_allclose(project(np.array([x, 2 * x]), one), [[-2, -2, -2], [-4, -4, -4]])
+
+
+def test_gram_schmidt():
+    vectors = rng.normal(size=(3, 6))
+    orthogonal = gram_schmidt(*vectors)
+    gram = orthogonal @ orthogonal.T
+    np.testing.assert_allclose(gram - np.diag(np.diag(gram)), 0, atol=1e-10)
+    # First vector unchanged, second is x - proj_1(x)
+    np.testing.assert_allclose(orthogonal[0], vectors[0], atol=1e-10)
+    np.testing.assert_allclose(orthogonal[1], vectors[1] - project(vectors[1], vectors[0]), atol=1e-10)
+
+
+def test_running_line_matches_one_shot_fit():
+    # Offset x so raw sums would lose precision to cancellation
+    x = rng.uniform(1e6, 1e6 + 10, 100_000)
+    y = 0.6 * x + rng.normal(0, 1.2, len(x))
+    running = RunningLine()
+    for start in range(0, len(x), 7777):
+        running.add(x[start:start + 7777], y[start:start + 7777])
+
+    coeffs = np.polyfit(x - 1e6, y, 1)
+    coeffs[1] -= coeffs[0] * 1e6
+    assert running.n == len(x)
+    np.testing.assert_allclose(running.fit(), coeffs, rtol=1e-8)
+    sse = np.sum((y - np.polyval(coeffs, x)) ** 2)
+    np.testing.assert_allclose(running.sse(), sse, rtol=1e-8)
+    np.testing.assert_allclose(running.sse([0.6, 0.0]), np.sum((y - 0.6 * x) ** 2), rtol=1e-8)
+
+
+def test_running_line_needs_two_x_values():
+    running = RunningLine().add([1.0, 1.0], [2.0, 3.0])
+    with pytest.raises(ValueError):
+        running.fit()
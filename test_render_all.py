@@ -0,0 +1,57 @@
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import render_all
+
+
+def fake_run(calls, num_plays):
+    def run(command, env=None, **kwargs):
+        calls.append((command, env))
+        stdout = f"{num_plays}\n" if command[1] == "-c" else ""
+        return subprocess.CompletedProcess(command, 0, stdout, "")
+
+    return run
+
+
+def test_discover_scenes_only_returns_the_video():
+    scenes = render_all.discover_scenes()
+    assert [scene[1] for scene in scenes] == render_all.VIDEO_ORDER
+    flags = {scene[1]: scene[2] for scene in scenes}
+    assert render_all.get_renderer(flags["RegressionVisualization"]) == "opengl"
+
+
+def test_split_ranges():
+    assert render_all.split_ranges(10, 3) == [(0, 2), (3, 6), (7, 9)]
+    assert render_all.split_ranges(2, 4) == [(0, 0), (1, 1)]
+
+
+def test_opengl_scene_is_counted_and_split_with_its_renderer(monkeypatch):
+    calls = []
+    monkeypatch.setattr(render_all.subprocess, "run", fake_run(calls, 4))
+    monkeypatch.setattr(render_all, "concat_movies", lambda input_files, output_file: None)
+    flags = ["--renderer=opengl", "--write_to_movie"]
+    scenes = [("regression_visualization.py", "RegressionVisualization", flags)]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        timings, failed = render_all.render_split(pool, scenes, 2, gl_threads=1)
+
+    assert not failed
+    (count_command, count_env), *segment_calls = calls
+    # Counted under OpenGL, in the same headless environment the segments render in
+    assert "config.renderer = 'opengl'" in count_command[2]
+    assert count_env["EGL_PLATFORM"] == "surfaceless"
+
+    ranges = sorted(command[command.index("-n") + 1] for command, _ in segment_calls)
+    assert ranges == ["0,1", "2,3"]
+    for command, env in segment_calls:
+        assert command[1:3] == flags
+        assert env["EGL_PLATFORM"] == "surfaceless"
+    assert "RegressionVisualization" in timings
+
+
+def test_cairo_scene_is_counted_with_cairo(monkeypatch):
+    calls = []
+    monkeypatch.setattr(render_all.subprocess, "run", fake_run(calls, 0))
+    _, returncode, num_plays, _ = render_all.count_animations("conclusion.py", "Conclusion", ["--renderer=cairo"])
+    assert (returncode, num_plays) == (0, 0)
+    assert "config.renderer = 'cairo'" in calls[0][0][2]
@@ -0,0 +1,125 @@
+from manim import *
+from manim.utils.tex_file_writing import generate_tex_file, make_tex_compilation_command
+import ast
+import hashlib
+import inspect
+import os
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+
+TEX_CALLS = {"MathTex", "Tex", "get_tex"}
+
+# Bare instance, only used to apply manim's own expression clean-up (stray braces, fillers) before hashing
+_expression_modifier = SingleStringMathTex.__new__(SingleStringMathTex)
+
+
+def collect_tex(source_file):
+    # (expression, environment) for every MathTex / Tex / brace.get_tex call whose arguments are all string
+    # literals; anything built at runtime (f-strings, DecimalNumber digits) still compiles on demand as before
+    tree = ast.parse(Path(source_file).read_text(encoding="utf-8"))
+    found = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = getattr(node.func, "id", None) or getattr(node.func, "attr", None)
+        if name not in TEX_CALLS or not node.args:
+            continue
+        if not all(isinstance(arg, ast.Constant) and isinstance(arg.value, str) for arg in node.args):
+            continue
+        kwargs = {kw.arg: kw.value for kw in node.keywords}
+        if {"substrings_to_isolate", "tex_to_color_map", "tex_template"} & kwargs.keys():
+            continue
+        if not all(isinstance(kwargs[key], ast.Constant) for key in ("arg_separator", "tex_environment") if key in kwargs):
+            continue
+
+        if name == "Tex":
+            separator = kwargs["arg_separator"].value if "arg_separator" in kwargs else ""
+            environment = kwargs["tex_environment"].value if "tex_environment" in kwargs else "center"
+        else:
+            separator = kwargs["arg_separator"].value if "arg_separator" in kwargs else " "
+            environment = kwargs["tex_environment"].value if "tex_environment" in kwargs else "align*"
+
+        # Same splitting MathTex does: the joined string is compiled once, then every piece on its own
+        pieces = [piece for arg in node.args for piece in re.split("{{(.*?)}}", arg.value) if piece]
+        for expression in [separator.join(pieces), *pieces]:
+            found.append((_expression_modifier._get_modified_expression(expression), environment))
+
+    return list(dict.fromkeys(found))
+
+
+def precompile_tex(expressions, tex_template=None):
+    # Compile every missing expression as one page of a single LaTeX document, convert all pages with one
+    # dvisvgm call, and store each page under the file name manim itself would look up
+    if config.dry_run:
+        # Nothing is drawn in a dry run; whatever still gets typeset compiles on demand
+        return
+    if tex_template is None:
+        tex_template = config["tex_template"]
+
+    pending = []
+    for expression, environment in expressions:
+        tex_file = generate_tex_file(expression, environment, tex_template)
+        if not tex_file.with_suffix(".svg").exists():
+            pending.append(tex_file)
+    pending = list(dict.fromkeys(pending))
+    if len(pending) < 2:
+        return
+
+    codes = [tex_file.read_text(encoding="utf-8") for tex_file in pending]
+    head = codes[0].split(r"\begin{document}")[0]
+    # standalone crops to a single page; article keeps one page per expression, and dvisvgm crops each page anyway
+    head = re.sub(r"\\documentclass(\[[^\]]*\])?\{standalone\}", r"\\documentclass{article}", head)
+    bodies = [code.split(r"\begin{document}")[1].split(r"\end{document}")[0] for code in codes]
+    batch = head + "\\pagestyle{empty}\n\\begin{document}\n" + "\n\\newpage\n".join(bodies) + "\n\\end{document}\n"
+
+    # Compiled in a private directory: with render_all.py --segments every worker replays setup() at the same
+    # time and builds the same batch. Not inside tex_dir, where manim's clean-up would try to unlink it as a file.
+    tex_dir = config.get_dir("tex_dir")
+    stem = "batch_" + hashlib.sha256(batch.encode()).hexdigest()[:16]
+    with tempfile.TemporaryDirectory(prefix="tex_batch_", dir=tex_dir.parent) as work_dir:
+        work_dir = Path(work_dir)
+        batch_file = work_dir / f"{stem}.tex"
+        batch_file.write_text(batch, encoding="utf-8")
+
+        logger.info("Compiling %(count)s TeX expressions in one batch", {"count": len(pending)})
+        command = make_tex_compilation_command(
+            tex_template.tex_compiler,
+            tex_template.output_format,
+            batch_file,
+            work_dir,
+        )
+        if subprocess.run(command, stdout=subprocess.DEVNULL).returncode == 0:
+            subprocess.run(
+                [
+                    "dvisvgm",
+                    *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+                    "--page=1-",
+                    "--no-fonts",
+                    "--verbosity=0",
+                    f"--output={(work_dir / stem).as_posix()}_%p.svg",
+                    batch_file.with_suffix(tex_template.output_format).as_posix(),
+                ],
+                stdout=subprocess.DEVNULL,
+            )
+        else:
+            logger.warning("Batch TeX compilation failed, expressions will be compiled one by one")
+
+        pages = {int(path.stem.rsplit("_", 1)[1]): path for path in work_dir.glob(f"{stem}_*.svg")}
+        if len(pages) == len(pending):
+            # Atomic, so a worker that lost the race just overwrites an identical file
+            for page, tex_file in enumerate(pending, start=1):
+                os.replace(pages[page], tex_file.with_suffix(".svg"))
+        else:
+            # An expression spilled onto a second page (or the compile failed): fall back to manim's own path
+            logger.warning(
+                "Batch TeX output has %(pages)s pages for %(count)s expressions", {"pages": len(pages), "count": len(pending)}
+            )
+
+
+class TexBatchMixin:
+    # Put in front of the Scene base class; compiles the scene module's literal TeX up front, before construct()
+    def setup(self):
+        super().setup()
+        precompile_tex(collect_tex(inspect.getsourcefile(type(self))))
@@ -0,0 +1,185 @@
+import argparse
+import importlib
+import inspect
+import json
+import linecache
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from benchmark import time_calls
+from render_all import discover_scenes
+
+# Hand-written running times in the scenes: a comment line that is just a number, or a sum ending in "= number",
+# e.g. "# 24.4" or "# 18.5 + 2 + 6 * 0.7 = 22.7" ("# total time: ..." lines are durations, not timestamps)
+MARKER = re.compile(r"^\s*#\s*(?:[\d.+*\s]+=\s*)?(\d+(?:\.\d+)?)\s*$")
+
+PLACEHOLDER_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8"><path d="M0 0h8v8h-8z"/></svg>'
+
+
+def skip_latex(placeholder_file):
+    # Cached TeX svgs are still used (they are cheap); anything not compiled yet becomes a small square instead
+    # of a LaTeX run, which is enough for layout calls and leaves every play/wait duration unchanged.
+    # Call before the scene modules are imported.
+    from manim import DEFAULT_FONT_SIZE, config
+    from manim.mobject.text import tex_mobject
+    from manim.utils.tex_file_writing import tex_hash
+
+    def cached_svg_or_placeholder(expression, environment=None, tex_template=None):
+        tex_template = tex_template or config["tex_template"]
+        if environment is not None:
+            texcode = tex_template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            texcode = tex_template.get_texcode_for_expression(expression)
+        svg_file = config.get_dir("tex_dir") / f"{tex_hash(texcode)}.svg"
+        return svg_file if svg_file.exists() else placeholder_file
+
+    tex_mobject.tex_to_svg_file = cached_svg_or_placeholder
+
+    # The placeholder lives in a fresh temp directory every run, so caching its points would only leave another
+    # file behind in media/svg_points each time
+    import svg_cache
+
+    cached = svg_cache.generate_mobject_cached
+
+    def generate_mobject(svg_mobject):
+        if Path(svg_mobject.get_file_path()).resolve() == placeholder_file.resolve():
+            return svg_cache.parse_svg(svg_mobject)
+        return cached(svg_mobject)
+
+    svg_cache.generate_mobject_cached = generate_mobject
+
+    # Live number labels are laid out from a glyph atlas typeset in one LaTeX run; the placeholder can't stand in
+    # for that run (it has one path, not one per glyph), so without an atlas every glyph becomes a small square
+    import glyphs
+
+    typeset_glyph_set = glyphs.get_glyph_set
+    placeholder_sets = {}
+
+    def get_glyph_set(font_size=DEFAULT_FONT_SIZE):
+        if glyphs.get_atlas_path(glyphs.GLYPH_TEX, font_size).exists():
+            return typeset_glyph_set(font_size)
+        # Kept apart from glyphs' own cache, so a later real render never picks up the squares
+        if font_size not in placeholder_sets:
+            placeholder_sets[font_size] = glyphs.GlyphSet(font_size=font_size, placeholder=True)
+        return placeholder_sets[font_size]
+
+    glyphs.get_glyph_set = get_glyph_set
+
+
+def get_markers(scene_class):
+    # (line, seconds) for every running-time comment inside construct()
+    lines, first_line = inspect.getsourcelines(scene_class.construct)
+    markers = []
+    for offset, text in enumerate(lines):
+        match = MARKER.match(text)
+        if match:
+            markers.append((first_line + offset, float(match.group(1))))
+    return markers
+
+
+def run_timeline(file_name, scene_name):
+    # construct() with every animation skipped (manim still advances scene time by each call's duration), no
+    # movie, no frames drawn and no LaTeX; records where each play/wait starts and how long it runs
+    module = importlib.import_module(Path(file_name).stem)
+    scene_class = getattr(module, scene_name)
+    construct_code = scene_class.construct.__code__
+    scene = scene_class()
+
+    calls = []
+
+    def on_start(call, frame):
+        # Calls made from helpers inside construct() also get the construct() line they were reached from
+        call["source"] = linecache.getline(frame.f_code.co_filename, call["line"]).strip()
+        while frame is not None and frame.f_code is not construct_code:
+            frame = frame.f_back
+        call["construct_line"] = frame.f_lineno if frame is not None else call["line"]
+
+    time_calls(scene, calls, on_start)
+    scene.render()
+
+    # A marker states the scene time when execution reaches its line, i.e. the end of the last call before it
+    markers = get_markers(scene_class)
+    checked = []
+    for line, expected in markers:
+        before = [call for call in calls if call["construct_line"] < line]
+        actual = before[-1]["start"] + before[-1]["duration"] if before else 0.0
+        checked.append({"line": line, "expected": expected, "actual": actual, "difference": actual - expected})
+
+    return {
+        "scene": scene_name,
+        "file": file_name,
+        "duration": scene.renderer.time,
+        "calls": calls,
+        "markers": checked,
+    }
+
+
+def print_timeline(timeline, tolerance):
+    print(f"\n{timeline['scene']} ({timeline['file']}), {timeline['duration']:.2f}s")
+    print(f"{'start':>8} {'dur':>6} {'end':>8} {'line':>5}  call")
+    # Calls in the order they ran, each marker right after the last call above it
+    markers = timeline["markers"]
+    index = 0
+    for call in timeline["calls"]:
+        while index < len(markers) and markers[index]["line"] < call["construct_line"]:
+            print_marker(markers[index], tolerance)
+            index += 1
+        end = call["start"] + call["duration"]
+        print(f"{call['start']:8.2f} {call['duration']:6.2f} {end:8.2f} {call['line']:5d}  {call['source']}")
+    for marker in markers[index:]:
+        print_marker(marker, tolerance)
+
+
+def print_marker(marker, tolerance):
+    flag = "  <-- off" if abs(marker["difference"]) > tolerance else ""
+    print(
+        f"{'':24}{marker['line']:5d}  # {marker['expected']:g}  actual {marker['actual']:.2f}"
+        f" ({marker['difference']:+.2f}){flag}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print when every play/wait starts and check the running-time comments, without rendering.")
+    parser.add_argument("scenes", nargs="*", help="Scene class names (default: all)")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Seconds a running-time comment may be off before it is flagged")
+    parser.add_argument("--json", help="Also write the timelines to this JSON file")
+    args = parser.parse_args()
+
+    from manim import config
+
+    # The scenes run one after the other in this process, so each costs construct() and nothing else. Cairo for
+    # all of them: skipped animations take the same time on either renderer, and it needs no OpenGL context.
+    config.dry_run = True
+    config.renderer = "cairo"
+    config.from_animation_number = 10 ** 9
+    config.verbosity = "ERROR"
+
+    # Only the video's scenes; demos like StreamingRegression are left out, as in render_all and benchmark
+    scenes = discover_scenes()
+    if args.scenes:
+        scenes = [scene for scene in scenes if scene[1] in args.scenes]
+
+    timelines = []
+    off = 0
+    with tempfile.TemporaryDirectory() as placeholder_dir:
+        placeholder_file = Path(placeholder_dir) / "placeholder.svg"
+        placeholder_file.write_text(PLACEHOLDER_SVG)
+        skip_latex(placeholder_file)
+
+        for file_name, scene_name, _ in scenes:
+            start = time.perf_counter()
+            timeline = run_timeline(file_name, scene_name)
+            timeline["seconds"] = time.perf_counter() - start
+            timelines.append(timeline)
+            print_timeline(timeline, args.tolerance)
+            off += sum(abs(marker["difference"]) > args.tolerance for marker in timeline["markers"])
+
+    print(f"\n{off} running-time comment(s) off by more than {args.tolerance}s")
+    if args.json:
+        Path(args.json).write_text(json.dumps(timelines, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+from manim import *
+from manim.mobject.opengl.opengl_mobject import OpenGLMobject
+import functools
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+
+class TrackerMemo:
+    def __init__(self, func, *trackers):
+        self.func = func
+        self.trackers = trackers
+        self.key = None
+        self.value = None
+
+    def __call__(self):
+        # Keyed on the tracker values, so every updater in the same frame shares one result and the old
+        # value is dropped as soon as a tracker moves on
+        key = tuple(tracker.get_value() for tracker in self.trackers)
+        if key != self.key:
+            self.key = key
+            self.value = self.func(*key)
+        return self.value
+
+
+def memoize_on(*trackers):
+    # Usage: @memoize_on(t_tracker) on a function taking the tracker values as arguments
+    def decorator(func):
+        return TrackerMemo(func, *trackers)
+
+    return decorator
+
+
+def describe_updater(func):
+    # "name (file.py:line)". Updaters manim builds itself (always_redraw, ...) are named after the function from
+    # this repo they close over, e.g. "always_redraw: construct.<locals>.<lambda> (regression_intro.py:218)"
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return getattr(func, "__qualname__", type(func).__name__)
+    if Path(code.co_filename).resolve().parent != ROOT:
+        for cell in getattr(func, "__closure__", None) or ():
+            try:
+                inner = cell.cell_contents
+            except ValueError:
+                continue
+            inner_code = getattr(inner, "__code__", None)
+            if inner_code is not None and Path(inner_code.co_filename).resolve().parent == ROOT:
+                return f"{func.__qualname__.split('.')[0]}: {describe_updater(inner)}"
+    return f"{func.__qualname__} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class UpdaterProfile:
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.stats = {}
+        self.wrappers = {}
+        self.installed = False
+
+    def wrap(self, func):
+        if func in self.wrappers:
+            return self.wrappers[func]
+        name = describe_updater(func)
+
+        # functools.wraps keeps the signature visible, which manim reads to tell dt updaters apart
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            if self.track_memory:
+                # Peak traced memory above the starting point: what the call allocated, even if it was freed again
+                tracemalloc.reset_peak()
+                start_memory = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                entry = self.stats.setdefault(name, [0, 0.0, 0])
+                entry[0] += 1
+                entry[1] += time.perf_counter() - start
+                if self.track_memory:
+                    entry[2] += tracemalloc.get_traced_memory()[1] - start_memory
+
+        self.wrappers[func] = timed
+        return timed
+
+    def install(self):
+        # Every updater added from now on is timed. remove_updater still works with the original function.
+        if self.installed:
+            return
+        self.installed = True
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        profile = self
+        for cls in (Mobject, OpenGLMobject):
+            add_updater = cls.add_updater
+            remove_updater = cls.remove_updater
+
+            def add(mob, update_function, *args, add_updater=add_updater, **kwargs):
+                return add_updater(mob, profile.wrap(update_function), *args, **kwargs)
+
+            def remove(mob, update_function, remove_updater=remove_updater):
+                return remove_updater(mob, profile.wrappers.get(update_function, update_function))
+
+            cls.add_updater = add
+            cls.remove_updater = remove
+
+    def report(self):
+        rows = [
+            {
+                "name": name,
+                "calls": calls,
+                "seconds": seconds,
+                "us_per_call": 1e6 * seconds / calls,
+                "bytes_allocated": allocated if self.track_memory else None,
+            }
+            for name, (calls, seconds, allocated) in self.stats.items()
+        ]
+        return sorted(rows, key=lambda row: row["seconds"], reverse=True)
+
+    def print_table(self, title="Updaters"):
+        rows = self.report()
+        total = sum(row["seconds"] for row in rows) or 1.0
+        print(f"\n{title}, slowest first")
+        print(f"{'calls':>8} {'total ms':>10} {'us/call':>9} {'share':>6} {'KiB/call':>9}  updater")
+        for row in rows:
+            memory = f"{row['bytes_allocated'] / row['calls'] / 1024:9.1f}" if self.track_memory else f"{'-':>9}"
+            print(
+                f"{row['calls']:8d} {1000 * row['seconds']:10.1f} {row['us_per_call']:9.1f} "
+                f"{100 * row['seconds'] / total:5.1f}% {memory}  {row['name']}"
+            )
+
+
+class UpdaterProfileMixin:
+    # Put in front of the Scene base class. Does nothing unless PROFILE_UPDATERS is set in the environment
+    # (PROFILE_UPDATERS=memory also tracks allocations); then prints the ranked updater table after the scene.
+    def __init__(self, *args, **kwargs):
+        mode = os.environ.get("PROFILE_UPDATERS")
+        self.updater_profile = UpdaterProfile(track_memory=mode == "memory") if mode else None
+        if self.updater_profile is not None:
+            self.updater_profile.install()
+        super().__init__(*args, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        if self.updater_profile is not None:
+            self.updater_profile.print_table(f"{type(self).__name__} updaters")